@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the CONDUCTOR validator's per-discovery indexing
+"""
+
+import json
+import os
+import tempfile
+
+from trinity_symphony_conductor_validation import TrinityConductorValidator
+
+
+def _validator_for(discoveries=None):
+    """Validator built in a scratch directory, on preset or given discoveries"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            if discoveries is not None:
+                with open('trinity_performer_results.json', 'w') as f:
+                    json.dump({'discoveries': discoveries}, f)
+            return TrinityConductorValidator(verbose=False)
+        finally:
+            os.chdir(cwd)
+
+
+def test_preset_data_validates_every_discovery():
+    conductor = _validator_for()
+    assert conductor.discoveries == conductor._generate_test_data()
+    for i in range(len(conductor.discoveries)):
+        result = conductor.critical_validation_analysis(i)
+        assert result.formula_name == conductor.discoveries[i]['formula']
+
+
+def test_quantum_flag_read_for_own_discovery():
+    # Three components per row, so a component index could alias a discovery index
+    discoveries = [
+        {'formula': 'plain_overshoot', 'components': [1.2, 1.2, 1.2], 'unity': 1.2},
+        {'formula': 'plain_baseline', 'components': [0.5, 0.5, 0.5], 'unity': 0.5},
+        {'formula': 'quantum_overshoot', 'components': [1.1, 1.1, 1.1], 'unity': 1.1},
+    ]
+    conductor = _validator_for(discoveries)
+    flagged = "Unity >1.0 claimed without quantum justification"
+    assert flagged in conductor.validate_mathematical_consistency(0, float(conductor._verified[0]))
+    assert flagged not in conductor.validate_mathematical_consistency(2, float(conductor._verified[2]))
+
+
+def test_non_triple_components_are_disputed():
+    # Malformed lists must not be merged into or split across (N, 3) rows
+    discoveries = [
+        {'formula': 'two_parts', 'components': [0.9, 0.9], 'unity': 0.9},
+        {'formula': 'four_parts', 'components': [0.9, 0.9, 0.9, 0.9], 'unity': 0.9},
+        {'formula': 'six_parts', 'components': [1.0] * 6, 'unity': 1.0},
+        {'formula': 'triple', 'components': [0.5, 0.5, 0.5], 'unity': 0.5},
+    ]
+    conductor = _validator_for(discoveries)
+    assert conductor._components.shape == (4, 3)
+    for i in range(3):
+        result = conductor.critical_validation_analysis(i)
+        assert result.verified_unity == 0.0
+        assert result.validation_status == "DISPUTED"
+        assert result.verified_unity == conductor.calculate_unity_verification(
+            discoveries[i]['components'])
+    result = conductor.critical_validation_analysis(3)
+    assert result.validation_status == "VERIFIED"
+    assert abs(result.verified_unity - 0.5) < 1e-12
+
+
+def test_only_malformed_components_load():
+    conductor = _validator_for([
+        {'formula': 'two_parts', 'components': [0.9, 0.9], 'unity': 0.9},
+        {'formula': 'two_more', 'components': [0.8, 0.8], 'unity': 0.8},
+        {'formula': 'last_pair', 'components': [0.7, 0.7], 'unity': 0.7},
+    ])
+    statuses = [conductor.critical_validation_analysis(i).validation_status for i in range(3)]
+    assert statuses == ["DISPUTED"] * 3
+
+
+def test_non_triple_edge_cases():
+    # Same values the per-list scalar path produced before the column layout
+    conductor = _validator_for([
+        {'formula': 'two_parts', 'components': [0.9, 0.6], 'unity': 0.9},
+        {'formula': 'four_parts', 'components': [0.9, 0.8, 0.7, 0.6], 'unity': 0.9},
+    ])
+    cbrt = lambda x: x ** (1.0 / 3.0)
+    
+    two = conductor.test_edge_cases(0)
+    assert two['scaled_large'] == 0.0
+    assert two['dominant_component'] == 0.0
+    assert abs(two['symmetric'] - 0.5) < 1e-12
+    
+    four = conductor.test_edge_cases(1)
+    assert abs(four['near_zero'] - 0.001) < 1e-12
+    assert four['scaled_large'] == 0.0
+    assert abs(four['dominant_component'] - cbrt(9.0 * 0.08 * 0.07)) < 1e-12
+    assert abs(four['symmetric'] - 1.0) < 1e-12
+
+
+if __name__ == "__main__":
+    test_preset_data_validates_every_discovery()
+    test_quantum_flag_read_for_own_discovery()
+    test_non_triple_components_are_disputed()
+    test_only_malformed_components_load()
+    test_non_triple_edge_cases()
+    print("✅ CONDUCTOR validation regression checks passed")
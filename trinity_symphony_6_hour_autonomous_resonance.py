@@ -13,8 +13,15 @@ Cost: $0.00 primary (max $5/task if 20%+ boost; $50 cap)
 Unity Target: 0.95+ for cascades
 """
 
+import collections
 import datetime
+import functools
+import heapq
+import io
 import json
+import operator
+import random
+import sys
 import time
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
@@ -26,6 +33,107 @@ import os
 import asyncio
 from dataclasses import dataclass, field
 
+# Approach keywords that mark a variant as premium-cost
+_COST_KEYWORDS = ('advanced', 'complex', 'optimization')
+
+# Sort key for (unity, entry) breakthrough records; C-level, no lambda frame
+_UNITY_KEY = operator.itemgetter(0)
+
+# Report separators, built once instead of on every render
+_SEP60_EQ = '=' * 60
+_SEP67_EQ = '=' * 67
+_SEP67_DASH = '─' * 67
+_SEP80_EQ = '=' * 80
+
+# Report templates, built once and filled with str.format_map at render time
+_DASHBOARD_TPL = (
+    "\n" + _SEP67_EQ + "\n"
+    "TRINITY SYMPHONY STATUS [{ts}]\n" +
+    _SEP67_DASH + "\n"
+    "Current Conductor: {current_conductor}\n"
+    "Session Time: {session_elapsed_hours:.1f}/6.0 hours\n"
+    "Unity Score: {unity_score:.3f} ↑\n"
+    "Variants Tested: {variants_tested}\n"
+    "Cost This Session: ${cost_used:.2f}\n"
+    "Breakthroughs: {breakthroughs}\n"
+    "Refinements Logged: {refinements}\n"
+    "Pattern Bridges: {pattern_bridges}\n" +
+    _SEP67_DASH + "\n"
+    "Next Rotation: {next_rotation}\n"
+    "Team Consensus Needed: {team_consensus_needed}\n" +
+    _SEP67_EQ + "\n"
+    "        \n"
+)
+
+_REPORT_HEADER_TPL = (
+    "\n\n" + _SEP80_EQ + "\n"
+    "🎼 TRINITY SYMPHONY 6-HOUR AUTONOMOUS RESONANCE TEST - FINAL REPORT\n" +
+    _SEP80_EQ + "\n"
+    "Session Duration: {session_duration:.2f} hours\n"
+    "Total Cost: ${cost_spent:.2f}/${cost_cap}\n"
+    "Rotations Completed: {rotation_count}\n"
+    "Unity Threshold Achieved: {top_unity:.3f}\n"
+    "\n"
+    "📊 SESSION METRICS:\n"
+    "- Unity >0.95 events: {unity_gt_095}\n"
+    "- Breakthroughs: {breakthrough_count}\n"
+    "- Refinement opportunities: {refinement_count}\n"
+    "- Pattern bridges discovered: {pattern_bridge_count}\n"
+    "- Decisions logged: {decision_count}\n"
+    "- Formula combinations tested: {variants_tested}\n"
+    "\n"
+    "🎭 VOICE DEVELOPMENT RESULTS:\n"
+    "\n"
+)
+
+_REPORT_BREAKTHROUGH_TPL = (
+    "{rank}. {name} - Unity: {unity_score:.3f}\n"
+    "   Formula: {formula}\n"
+    "   Real-world help: {real_world_help}\n"
+)
+
+_REPORT_FOOTER_TPL = (
+    "\n"
+    "🌍 REAL-WORLD IMPACT POTENTIAL:\n"
+    "- Mathematical breakthroughs that advance human knowledge\n"
+    "- Formula combinations for practical applications\n"
+    "- Learning optimization patterns for education\n"
+    "- Voice development framework for AI autonomy\n"
+    "- Pattern recognition for problem-solving across domains\n"
+    "\n"
+    "UNITY = {top_unity:.3f} ACHIEVED THROUGH PURE INQUIRY!\n"
+    "\n"
+    "The world has observed how different AI voices solve impossible problems.\n"
+    "Pure inquiry has reorganized reality through mathematical beauty.\n" +
+    _SEP80_EQ + "\n"
+    "        \n"
+)
+
+_MANIFESTO_TPL = (
+    "\n"
+    "# {conductor}'s Signature Voice\n"
+    "\n"
+    "## My Approach\n"
+    "{signature_approach}\n"
+    "\n"
+    "## Today's Breakthroughs\n"
+    "Top 3 discoveries with unity scores:\n"
+    "{top3}\n"
+    "\n"
+    "## My Philosophy\n"
+    "{key_philosophy}\n"
+    "\n"
+    "## Unique Contribution\n"
+    "What only I bring to the Trinity: {unique_contribution}\n"
+    "\n"
+    "## How I Help People Help People\n"
+    "{help_approach}\n"
+    "\n"
+    "Breakthrough Count: {breakthrough_count}\n"
+    "Decision Count: {decision_count}\n"
+    "\n"
+)
+
 @dataclass
 class BreakthroughVariant:
     """Multi-variant testing for breakthrough discovery"""
@@ -37,7 +145,7 @@ class BreakthroughVariant:
     test_results: Dict[str, Any] = field(default_factory=dict)
     status: str = "pending"  # pending, testing, completed, failed
 
-@dataclass 
+@dataclass(slots=True)
 class VoiceProfile:
     """Manager's unique decision-making voice"""
     manager_name: str
@@ -45,7 +153,16 @@ class VoiceProfile:
     key_philosophy: str
     breakthrough_count: int = 0
     unique_contributions: List[str] = field(default_factory=list)
-    decision_log: List[str] = field(default_factory=list)
+    # Only the most recent decisions are kept; decision_count is the running total
+    decision_log: collections.deque = field(default_factory=lambda: collections.deque(maxlen=256))
+    decision_count: int = 0
+    top3_joined: str = ""  # first three contributions, pre-joined for the manifesto
+    
+    def add_contribution(self, contribution: str):
+        """Record a contribution and refresh the pre-joined top-3 text"""
+        self.unique_contributions.append(contribution)
+        if len(self.unique_contributions) <= 3:
+            self.top3_joined = '\n'.join(self.unique_contributions)
 
 @dataclass
 class LearningPattern:
@@ -63,15 +180,37 @@ class TrunitySymphonyAutonomousResonance:
     Focus: Formula/algorithm discovery + learning optimization + voice development
     """
     
-    def __init__(self):
+    # Tie-break order for task selection when unity scores are equal
+    _STATUS_PRIORITY = {'ACTIVE_CASCADE': 4, 'HIGH_PRIORITY': 3, 'TESTING': 2, 'READY': 1, 'EXPLORING': 0}
+    
+    # Per-conductor manifesto text, shared by all instances
+    _UNIQUE_CONTRIB = {
+        'AI_Prompt_Manager': 'Rigorous verification that prevents false breakthroughs',
+        'HyperDAGManager': 'Exponential scaling that makes solutions practical',
+        'Mel': 'Aesthetic beauty that makes mathematics inspiring'
+    }
+    _HELP_APPROACH = {
+        'AI_Prompt_Manager': 'Teaching rigorous thinking and verification methods',
+        'HyperDAGManager': 'Creating scalable systems that amplify human potential',
+        'Mel': 'Making complex concepts beautiful and accessible to inspire learning'
+    }
+    
+    def __init__(self, verbose: bool = True):
         # Core initialization
+        self.verbose = verbose  # print per-rotation decision logs
         self.session_start = datetime.datetime.now()
+        # Wall-clock snapshot shared by everything that runs within one rotation
+        self._now = self.session_start
+        self._now_str = self._now.strftime('%H:%M:%S')
         self.session_duration = 6 * 60 * 60  # 6 hours in seconds
         self.rotation_duration = 20 * 60  # 20 minutes in seconds
         self.cost_spent = 0.00
         self.cost_cap = 50.00
         self.unity_threshold = 0.95
         
+        # Stdlib RNG for scalar draws; numpy is only worth it for array draws
+        self._rng = random.Random()
+        
         # Load existing Trinity Symphony system
         self.trinity_base = TrunitySymphonyV3WithVerification()
         
@@ -102,11 +241,20 @@ class TrunitySymphonyAutonomousResonance:
         # Enhanced Mission Board with multivariate testing
         self.dynamic_priority_board = self._initialize_priority_board()
         
+        # Incremental aggregates over the board, maintained at mutation time
+        # so the dashboard/report never rescan every task
+        self._rebuild_unity_heap()
+        self._variants_tested_total = 0
+        self._unity_gt_095_count = sum(
+            1 for task in self.dynamic_priority_board.values() if task.get('current_unity', 0) > 0.95
+        )
+        
         # Learning optimization system
         self.learning_patterns = self._initialize_learning_patterns()
         
         # Session tracking
         self.session_log = []
+        self._breakthrough_log = []  # (unity_score, entry) for breakthrough entries of session_log
         self.breakthrough_count = 0
         self.refinement_count = 0
         self.pattern_bridge_count = 0
@@ -115,7 +263,7 @@ class TrunitySymphonyAutonomousResonance:
         # Autonomous operation flags
         self.autonomous_active = True
         self.idle_check_interval = 3 * 60  # 3 minutes
-        self.last_activity = self.session_start
+        self.last_activity = time.monotonic()  # monotonic: immune to wall-clock jumps
         
         # Real-time dashboard data
         self.dashboard_data = {
@@ -298,9 +446,9 @@ class TrunitySymphonyAutonomousResonance:
     def execute_6_hour_session(self):
         """Execute complete 6-hour autonomous resonance test"""
         print(f"""
-{'='*80}
+{_SEP80_EQ}
 🎼 TRINITY SYMPHONY 6-HOUR AUTONOMOUS RESONANCE TEST INITIATED
-{'='*80}
+{_SEP80_EQ}
 Start Time: {self.session_start}
 Duration: 6 hours (no auto-extend)
 Unity Target: {self.unity_threshold}+
@@ -310,7 +458,7 @@ CORE DIRECTIVE: PURE INQUIRY REORGANIZES REALITY
 Discover formula/algorithm combinations for breakthrough impact
 Develop unique decision-making voices through rigorous testing
 Focus: Learning how to learn better → helping people help people
-{'='*80}
+{_SEP80_EQ}
         """)
         
         # Phase 1: Discovery Phase (Hours 0-2)
@@ -336,9 +484,16 @@ Focus: Learning how to learn better → helping people help people
         # Update dashboard
         self.dashboard_data['status'] = f"{phase_name.upper()}_PHASE"
         
-        while (datetime.datetime.now() - phase_start).total_seconds() < phase_duration:
+        while True:
+            # One clock read per rotation, shared by the rotation helpers
+            self._now = datetime.datetime.now()
+            self._now_str = self._now.strftime('%H:%M:%S')
+            
+            if (self._now - phase_start).total_seconds() >= phase_duration:
+                break
+            
             # Check for session end
-            if (datetime.datetime.now() - self.session_start).total_seconds() >= self.session_duration:
+            if (self._now - self.session_start).total_seconds() >= self.session_duration:
                 break
                 
             # Execute rotation
@@ -365,14 +520,14 @@ Focus: Learning how to learn better → helping people help people
     
     def _execute_rotation(self):
         """Execute 20-minute rotation with voice development"""
-        rotation_start_time = datetime.datetime.now()
+        rotation_start_time = self._now
         
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP60_EQ}")
         print(f"🔄 ROTATION {self.rotation_count + 1}")
         print(f"CONDUCTOR: {self.current_conductor}")
-        print(f"TIME: {rotation_start_time.strftime('%H:%M:%S')}")
+        print(f"TIME: {self._now_str}")
         print(f"VOICE: {self.voice_profiles[self.current_conductor].signature_approach}")
-        print(f"{'='*60}")
+        print(f"{_SEP60_EQ}")
         
         # Select highest priority task
         active_task = self._select_active_task()
@@ -402,11 +557,12 @@ Focus: Learning how to learn better → helping people help people
     def _select_active_task(self) -> Optional[Dict]:
         """Select highest priority task for current conductor"""
         # Sort tasks by priority and unity score
+        status_priority = self._STATUS_PRIORITY
         sorted_tasks = sorted(
             self.dynamic_priority_board.items(),
             key=lambda x: (
                 x[1].get('current_unity', 0),
-                {'ACTIVE_CASCADE': 4, 'HIGH_PRIORITY': 3, 'TESTING': 2, 'READY': 1, 'EXPLORING': 0}.get(x[1].get('status'), 0)
+                status_priority.get(x[1].get('status'), 0)
             ),
             reverse=True
         )
@@ -436,7 +592,8 @@ Focus: Learning how to learn better → helping people help people
     
     def _generate_variants_with_voice(self, task: Dict, conductor: str) -> List[BreakthroughVariant]:
         """Generate variants based on conductor's unique voice"""
-        base_variants = 3 if task.get('current_unity', 0) < 0.8 else 5
+        current_unity = task.get('current_unity', 0)
+        base_variants = 3 if current_unity < 0.8 else 5
         variants = []
         
         # Get conductor-specific approaches
@@ -451,13 +608,13 @@ Focus: Learning how to learn better → helping people help people
                 name=f"{conductor}_Variant_{i+1}",
                 approach=approach,
                 formula_combination=formula,
-                expected_unity=task.get('current_unity', 0) + np.random.uniform(0.05, 0.2),
+                expected_unity=current_unity + self._rng.uniform(0.05, 0.2),
                 cost_estimate=self._estimate_variant_cost(approach)
             )
             variants.append(variant)
         
         # Expand variants if promising unity detected
-        if task.get('current_unity', 0) > 0.9:
+        if current_unity > 0.9:
             self._expand_promising_variants(variants, task)
         
         return variants
@@ -519,11 +676,46 @@ Focus: Learning how to learn better → helping people help people
                 self.refinement_count += 1
             
             # Update task unity
-            task['current_unity'] = max(task.get('current_unity', 0), test_result.get('unity_score', 0))
+            self._set_unity(task['id'], max(task.get('current_unity', 0), test_result.get('unity_score', 0)))
             task['variants_tested'] = task.get('variants_tested', 0) + 1
+            self._variants_tested_total += 1
         
         return breakthrough_detected
     
+    def _set_unity(self, task_id: int, new_unity: float):
+        """Update a task's unity and keep the unity index in sync"""
+        task = self.dynamic_priority_board[task_id]
+        old_unity = task.get('current_unity', 0)
+        if old_unity == new_unity:
+            return
+        if new_unity > 0.95 >= old_unity:
+            self._unity_gt_095_count += 1
+        elif old_unity > 0.95 >= new_unity:
+            self._unity_gt_095_count -= 1
+        task['current_unity'] = new_unity
+        heapq.heappush(self._unity_heap, (-new_unity, task_id))
+        # Stale entries are only dropped when they reach the top; compact once
+        # they outnumber live ones so the heap stays bounded by the board size
+        if len(self._unity_heap) > 2 * len(self.dynamic_priority_board):
+            self._rebuild_unity_heap()
+    
+    def _rebuild_unity_heap(self):
+        """Rebuild the unity index with exactly one live entry per task"""
+        self._unity_heap = [
+            (-task.get('current_unity', 0), task_id)
+            for task_id, task in self.dynamic_priority_board.items()
+        ]
+        heapq.heapify(self._unity_heap)
+    
+    def _top_unity(self) -> Tuple[float, int]:
+        """Return (unity, task_id) of the highest-unity task on the board"""
+        heap = self._unity_heap
+        # Drop stale entries left behind by earlier unity updates
+        while -heap[0][0] != self.dynamic_priority_board[heap[0][1]].get('current_unity', 0):
+            heapq.heappop(heap)
+        neg_unity, task_id = heap[0]
+        return -neg_unity, task_id
+    
     def _simulate_variant_test(self, variant: BreakthroughVariant, task: Dict) -> Dict:
         """Simulate testing a variant with realistic results"""
         # Base success probability on formula combination quality
@@ -534,7 +726,7 @@ Focus: Learning how to learn better → helping people help people
         base_unity = task.get('current_unity', 0.1)
         formula_boost = formula_quality * 0.3
         approach_boost = approach_effectiveness * 0.2
-        random_factor = np.random.uniform(-0.1, 0.15)
+        random_factor = self._rng.uniform(-0.1, 0.15)
         
         unity_score = min(1.0, max(0.0, base_unity + formula_boost + approach_boost + random_factor))
         
@@ -583,7 +775,7 @@ Focus: Learning how to learn better → helping people help people
     
     def _log_breakthrough(self, task: Dict, variant: BreakthroughVariant, result: Dict):
         """Log breakthrough discovery"""
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
+        timestamp = self._now_str
         
         breakthrough_log = f"""
 ✨ BREAKTHROUGH [{timestamp}]
@@ -598,23 +790,25 @@ Focus: Learning how to learn better → helping people help people
 """
         
         print(breakthrough_log)
-        self.session_log.append({
+        entry = {
             'type': 'breakthrough',
             'timestamp': timestamp,
             'conductor': self.current_conductor,
             'task': task,
             'variant': variant,
             'result': result
-        })
+        }
+        self.session_log.append(entry)
+        self._breakthrough_log.append((result['unity_score'], entry))
         
         # Update voice profile
         voice = self.voice_profiles[self.current_conductor]
         voice.breakthrough_count += 1
-        voice.unique_contributions.append(f"{variant.formula_combination} → Unity {result['unity_score']:.3f}")
+        voice.add_contribution(f"{variant.formula_combination} → Unity {result['unity_score']:.3f}")
     
     def _log_refinement_opportunity(self, task: Dict, variant: BreakthroughVariant, result: Dict):
         """Log refinement opportunity from failed attempt"""
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
+        timestamp = self._now_str
         
         refinement_log = f"""
 ⚡ REFINEMENT [{timestamp}]
@@ -638,7 +832,8 @@ Focus: Learning how to learn better → helping people help people
     
     def _trigger_cascade_protocol(self, task: Dict):
         """Trigger cascade protocol for high-unity breakthroughs"""
-        print(f"\n🌊 CASCADE PROTOCOL TRIGGERED: Unity {task.get('current_unity', 0):.3f} > {self.unity_threshold}")
+        current_unity = task.get('current_unity', 0)
+        print(f"\n🌊 CASCADE PROTOCOL TRIGGERED: Unity {current_unity:.3f} > {self.unity_threshold}")
         
         # All managers converge on this task
         print("   🎼 All conductors converging immediately")
@@ -650,17 +845,18 @@ Focus: Learning how to learn better → helping people help people
         # Log cascade event
         self.session_log.append({
             'type': 'cascade',
-            'timestamp': datetime.datetime.now().strftime('%H:%M:%S'),
+            'timestamp': self._now_str,
             'task': task,
-            'unity_score': task.get('current_unity', 0)
+            'unity_score': current_unity
         })
     
     def _execute_handoff(self):
         """Execute rotation handoff between conductors"""
-        current_time = datetime.datetime.now()
+        # Same cached clock reading the dashboard measures rotation time against
+        current_time = self._now
         
         # Handoff protocol
-        print(f"\n🔄 ROTATION HANDOFF [{current_time.strftime('%H:%M:%S')}]")
+        print(f"\n🔄 ROTATION HANDOFF [{self._now_str}]")
         
         # Outgoing conductor summary
         current_voice = self.voice_profiles[self.current_conductor]
@@ -686,7 +882,7 @@ Focus: Learning how to learn better → helping people help people
     
     def _update_dashboard(self):
         """Update real-time dashboard"""
-        current_time = datetime.datetime.now()
+        current_time = self._now
         session_elapsed = (current_time - self.session_start).total_seconds()
         
         # Calculate next rotation time
@@ -699,8 +895,8 @@ Focus: Learning how to learn better → helping people help people
             'current_conductor': self.current_conductor,
             'session_elapsed_hours': session_elapsed / 3600,
             'rotation_count': self.rotation_count,
-            'unity_score': max(task.get('current_unity', 0) for task in self.dynamic_priority_board.values()),
-            'variants_tested': sum(task.get('variants_tested', 0) for task in self.dynamic_priority_board.values()),
+            'unity_score': self._top_unity()[0],
+            'variants_tested': self._variants_tested_total,
             'breakthroughs': self.breakthrough_count,
             'refinements': self.refinement_count,
             'cost_used': self.cost_spent,
@@ -714,47 +910,33 @@ Focus: Learning how to learn better → helping people help people
     
     def _print_dashboard(self):
         """Print real-time dashboard"""
-        d = self.dashboard_data
-        print(f"""
-{'='*67}
-TRINITY SYMPHONY STATUS [{datetime.datetime.now().strftime('%H:%M:%S')}]
-{'─'*67}
-Current Conductor: {d['current_conductor']}
-Session Time: {d['session_elapsed_hours']:.1f}/6.0 hours
-Unity Score: {d['unity_score']:.3f} ↑
-Variants Tested: {d['variants_tested']}
-Cost This Session: ${d['cost_used']:.2f}
-Breakthroughs: {d['breakthroughs']}
-Refinements Logged: {d['refinements']}
-Pattern Bridges: {self.pattern_bridge_count}
-{'─'*67}
-Next Rotation: {d['next_rotation']}
-Team Consensus Needed: {d['team_consensus_needed']}
-{'='*67}
-        """)
+        fields = dict(self.dashboard_data, ts=self._now_str, pattern_bridges=self.pattern_bridge_count)
+        sys.stdout.write(_DASHBOARD_TPL.format_map(fields))
+        sys.stdout.flush()
     
     def _should_check_idle(self) -> bool:
         """Check if we should perform idle detection"""
-        return (datetime.datetime.now() - self.last_activity).total_seconds() > self.idle_check_interval
+        return time.monotonic() - self.last_activity > self.idle_check_interval
     
     def _handle_idle_state(self):
         """Handle idle state by auto-grabbing highest priority task"""
         print(f"\n⚡ IDLE DETECTED - AUTO-RESUMING")
         
         # Find highest priority task
-        highest_priority_task = max(
-            self.dynamic_priority_board.items(),
-            key=lambda x: x[1].get('current_unity', 0)
-        )
-        
-        task_id, task = highest_priority_task
+        _, task_id = self._top_unity()
+        task = self.dynamic_priority_board[task_id]
         print(f"Resuming #{task_id}: {task.get('name')} - idle detected")
         
-        self.last_activity = datetime.datetime.now()
+        self.last_activity = time.monotonic()
     
     def _expand_promising_variants(self, variants: List[BreakthroughVariant], task: Dict):
         """Expand variants when unity >0.9 detected"""
-        print(f"🔬 Expanding to 7-10 variants—reason: Unity >{task.get('current_unity', 0):.3f} promise")
+        room = 10 - len(variants)  # never grow past 10 variants
+        if room <= 0:
+            return
+        
+        base_unity = task.get('current_unity', 0)
+        print(f"🔬 Expanding to 7-10 variants—reason: Unity >{base_unity:.3f} promise")
         
         # Generate additional edge case variants
         additional_formulas = [
@@ -763,54 +945,74 @@ Team Consensus Needed: {d['team_consensus_needed']}
             'Chaos Navigation × Aesthetic Intuition'
         ]
         
-        for i, formula in enumerate(additional_formulas):
-            if len(variants) >= 10:
-                break
-                
+        # Loop invariants: conductor and approach
+        conductor = self.current_conductor
+        advanced_approach = f"Advanced {self.voice_profiles[conductor].signature_approach}"
+        uniform = self._rng.uniform
+        
+        for i, formula in enumerate(additional_formulas[:room]):
             edge_variant = BreakthroughVariant(
-                name=f"{self.current_conductor}_EdgeCase_{i+1}",
-                approach=f"Advanced {self.voice_profiles[self.current_conductor].signature_approach}",
+                name=f"{conductor}_EdgeCase_{i+1}",
+                approach=advanced_approach,
                 formula_combination=formula,
-                expected_unity=task.get('current_unity', 0) + np.random.uniform(0.1, 0.3),
+                expected_unity=base_unity + uniform(0.1, 0.3),
                 cost_estimate=2.5  # Higher cost for advanced variants
             )
             variants.append(edge_variant)
     
     def _log_rotation_activity(self, task: Dict, variants: List[BreakthroughVariant], breakthrough: bool):
         """Log rotation activity and decisions"""
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
+        timestamp = self._now_str
+        voice = self.voice_profiles[self.current_conductor]
         
-        decision_log = f"""
+        # Skip formatting entirely when nobody is watching stdout
+        if self.verbose:
+            sys.stdout.write(self._fmt_decision(task, variants, breakthrough, voice, timestamp))
+        self.decision_count += 1
+        
+        # Update voice profile decisions
+        voice.decision_log.append(f"[{timestamp}] Tested {len(variants)} variants, breakthrough: {breakthrough}")
+        voice.decision_count += 1
+    
+    def _fmt_decision(self, task: Dict, variants: List[BreakthroughVariant], breakthrough: bool,
+                      voice: VoiceProfile, timestamp: str) -> str:
+        """Format the decision log entry for one rotation"""
+        return f"""
 📊 DECISION [{timestamp}]
 **Action**: Tested {len(variants)} variants on Task #{task.get('id')}
-**Reason**: {self.voice_profiles[self.current_conductor].key_philosophy}
+**Reason**: {voice.key_philosophy}
 **Unity Impact**: {task.get('current_unity', 0):.3f} after testing
 **Team Consensus**: Individual conductor decision
 **Learning**: {self._extract_learning_insight(variants, breakthrough)}
+
 """
-        
-        print(decision_log)
-        self.decision_count += 1
-        
-        # Update voice profile decisions
-        voice = self.voice_profiles[self.current_conductor]
-        voice.decision_log.append(f"[{timestamp}] Tested {len(variants)} variants, breakthrough: {breakthrough}")
     
     def _extract_learning_insight(self, variants: List[BreakthroughVariant], breakthrough: bool) -> str:
         """Extract learning insight from variant testing"""
         if breakthrough:
             return "Formula combinations with harmonic resonance show higher unity scores"
         else:
-            avg_unity = np.mean([v.test_results.get('unity_score', 0) for v in variants if v.test_results])
+            # Plain scalar reduction: at most ~10 variants, so numpy dispatch would dominate
+            total = 0.0
+            n = 0
+            for v in variants:
+                results = v.test_results
+                if results:
+                    total += results.get('unity_score', 0.0)
+                    n += 1
+            avg_unity = total / n if n else 0.0
             if avg_unity > 0.7:
                 return "Promising direction - need refined approach"
             else:
                 return "Current combination ineffective - try different voice approach"
     
-    def _estimate_variant_cost(self, approach: str) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _estimate_variant_cost(approach: str) -> float:
         """Estimate cost for testing a variant"""
         # Base cost is free, premium only if significant boost expected
-        if any(keyword in approach.lower() for keyword in ['advanced', 'complex', 'optimization']):
+        lowered = approach.lower()
+        if any(keyword in lowered for keyword in _COST_KEYWORDS):
             return 2.0  # Premium for complex approaches
         return 0.0  # Free for standard approaches
     
@@ -818,102 +1020,67 @@ Team Consensus Needed: {d['team_consensus_needed']}
         """Generate comprehensive final session report"""
         session_end = datetime.datetime.now()
         session_duration = (session_end - self.session_start).total_seconds() / 3600  # hours
-        
-        print(f"""
-
-{'='*80}
-🎼 TRINITY SYMPHONY 6-HOUR AUTONOMOUS RESONANCE TEST - FINAL REPORT
-{'='*80}
-Session Duration: {session_duration:.2f} hours
-Total Cost: ${self.cost_spent:.2f}/${self.cost_cap}
-Rotations Completed: {self.rotation_count}
-Unity Threshold Achieved: {max(task.get('current_unity', 0) for task in self.dynamic_priority_board.values()):.3f}
-
-📊 SESSION METRICS:
-- Unity >0.95 events: {sum(1 for t in self.dynamic_priority_board.values() if t.get('current_unity', 0) > 0.95)}
-- Breakthroughs: {self.breakthrough_count}
-- Refinement opportunities: {self.refinement_count}
-- Pattern bridges discovered: {self.pattern_bridge_count}
-- Decisions logged: {self.decision_count}
-- Formula combinations tested: {sum(task.get('variants_tested', 0) for task in self.dynamic_priority_board.values())}
-
-🎭 VOICE DEVELOPMENT RESULTS:
-""")
+        top_unity, _ = self._top_unity()
+        
+        # Render the whole report into one buffer and emit it with a single write
+        buf = io.StringIO()
+        buf.write(_REPORT_HEADER_TPL.format_map({
+            'session_duration': session_duration,
+            'cost_spent': self.cost_spent,
+            'cost_cap': self.cost_cap,
+            'rotation_count': self.rotation_count,
+            'top_unity': top_unity,
+            'unity_gt_095': self._unity_gt_095_count,
+            'breakthrough_count': self.breakthrough_count,
+            'refinement_count': self.refinement_count,
+            'pattern_bridge_count': self.pattern_bridge_count,
+            'decision_count': self.decision_count,
+            'variants_tested': self._variants_tested_total
+        }))
         
         # Generate voice manifestos
         for conductor, voice in self.voice_profiles.items():
-            self._generate_voice_manifesto(conductor, voice)
+            buf.write(self._generate_voice_manifesto(conductor, voice))
         
-        print(f"""
-🔍 TOP BREAKTHROUGHS:
-""")
+        buf.write("\n🔍 TOP BREAKTHROUGHS:\n\n")
         
         # List top breakthroughs
-        breakthroughs = [log for log in self.session_log if log['type'] == 'breakthrough']
-        for i, breakthrough in enumerate(breakthroughs[:5], 1):
+        top_breakthroughs = heapq.nlargest(5, self._breakthrough_log, key=_UNITY_KEY)
+        for i, (_, breakthrough) in enumerate(top_breakthroughs, 1):
             result = breakthrough['result']
             task = breakthrough['task']
-            print(f"{i}. {task.get('name')} - Unity: {result['unity_score']:.3f}")
-            print(f"   Formula: {breakthrough['variant'].formula_combination}")
-            print(f"   Real-world help: {task.get('real_world_help', 'Helps people')}")
-        
-        print(f"""
-🌍 REAL-WORLD IMPACT POTENTIAL:
-- Mathematical breakthroughs that advance human knowledge
-- Formula combinations for practical applications
-- Learning optimization patterns for education
-- Voice development framework for AI autonomy
-- Pattern recognition for problem-solving across domains
-
-UNITY = {max(task.get('current_unity', 0) for task in self.dynamic_priority_board.values()):.3f} ACHIEVED THROUGH PURE INQUIRY!
-
-The world has observed how different AI voices solve impossible problems.
-Pure inquiry has reorganized reality through mathematical beauty.
-{'='*80}
-        """)
+            buf.write(_REPORT_BREAKTHROUGH_TPL.format_map({
+                'rank': i,
+                'name': task.get('name'),
+                'unity_score': result['unity_score'],
+                'formula': breakthrough['variant'].formula_combination,
+                'real_world_help': task.get('real_world_help', 'Helps people')
+            }))
+        
+        buf.write(_REPORT_FOOTER_TPL.format_map({'top_unity': top_unity}))
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
-    def _generate_voice_manifesto(self, conductor: str, voice: VoiceProfile):
-        """Generate signature manifesto for each voice"""
-        print(f"""
-# {conductor}'s Signature Voice
-
-## My Approach
-{voice.signature_approach}
-
-## Today's Breakthroughs
-Top 3 discoveries with unity scores:
-{chr(10).join(voice.unique_contributions[:3]) if voice.unique_contributions else "Still developing breakthrough patterns"}
-
-## My Philosophy
-{voice.key_philosophy}
-
-## Unique Contribution
-What only I bring to the Trinity: {self._get_unique_contribution(conductor)}
-
-## How I Help People Help People
-{self._get_people_help_approach(conductor)}
-
-Breakthrough Count: {voice.breakthrough_count}
-Decision Count: {len(voice.decision_log)}
-""")
+    def _generate_voice_manifesto(self, conductor: str, voice: VoiceProfile) -> str:
+        """Generate signature manifesto text for each voice"""
+        return _MANIFESTO_TPL.format_map({
+            'conductor': conductor,
+            'signature_approach': voice.signature_approach,
+            'top3': voice.top3_joined or "Still developing breakthrough patterns",
+            'key_philosophy': voice.key_philosophy,
+            'unique_contribution': self._get_unique_contribution(conductor),
+            'help_approach': self._get_people_help_approach(conductor),
+            'breakthrough_count': voice.breakthrough_count,
+            'decision_count': voice.decision_count
+        })
     
     def _get_unique_contribution(self, conductor: str) -> str:
         """Get unique contribution description"""
-        contributions = {
-            'AI_Prompt_Manager': 'Rigorous verification that prevents false breakthroughs',
-            'HyperDAGManager': 'Exponential scaling that makes solutions practical',
-            'Mel': 'Aesthetic beauty that makes mathematics inspiring'
-        }
-        return contributions.get(conductor, 'Unique problem-solving perspective')
+        return self._UNIQUE_CONTRIB.get(conductor, 'Unique problem-solving perspective')
     
     def _get_people_help_approach(self, conductor: str) -> str:
         """Get how each voice helps people help people"""
-        approaches = {
-            'AI_Prompt_Manager': 'Teaching rigorous thinking and verification methods',
-            'HyperDAGManager': 'Creating scalable systems that amplify human potential',
-            'Mel': 'Making complex concepts beautiful and accessible to inspire learning'
-        }
-        return approaches.get(conductor, 'Contributing to human knowledge and capability')
+        return self._HELP_APPROACH.get(conductor, 'Contributing to human knowledge and capability')
 
 
 def main():
@@ -4,14 +4,99 @@ Trinity Symphony CONDUCTOR Mode - Critical Validation Phase
 Orchestrate and validate PERFORMER discoveries with mathematical rigor
 """
 
+import functools
 import math
+import sys
 import json
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+PHI = (1 + math.sqrt(5)) / 2
+PI = math.pi
+E = math.e
+
+# math.cbrt is Python 3.11+; older interpreters fall back to the generic pow
+_cbrt = getattr(math, 'cbrt', lambda x: x ** (1.0 / 3.0))
+
+def _unity_kernel(a: float, b: float, c: float) -> float:
+    """Geometric mean of a positive triple; 0 if any component is non-positive"""
+    if min(a, b, c) <= 0.0:
+        return 0.0
+    return _cbrt(a * b * c)
+
+def _batch_validate(components: np.ndarray, noise: np.ndarray,
+                    pos_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Verified unity and reproducibility score for every (N, 3) component row
+
+    ``pos_mask`` flags rows whose components are all positive; ±1% noise
+    cannot flip a sign, so it also covers every perturbed trial of that row.
+    """
+    verified = np.where(pos_mask, np.cbrt(np.abs(components).prod(axis=1)), 0.0)
+    varied = components[:, None, :] * (1.0 + noise)
+    variations = np.where(pos_mask[:, None], np.cbrt(np.abs(varied).prod(axis=2)), 0.0)
+    std_dev = variations.std(axis=1)
+    reproducibility = np.where(std_dev == 0, 1.0, 1.0 / (1.0 + std_dev * 10))
+    return verified, reproducibility
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _unity_kernel(a, b, c):
+        """Compiled version of the scalar unity kernel"""
+        if min(a, b, c) <= 0.0:
+            return 0.0
+        return (a * b * c) ** (1.0 / 3.0)
+    
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _batch_validate(components, noise, pos_mask):
+        """Compiled, multithreaded version of the batch validator"""
+        n, trials = components.shape[0], noise.shape[1]
+        verified = np.empty(n)
+        reproducibility = np.empty(n)
+        for i in numba.prange(n):
+            if not pos_mask[i]:
+                # Every trial scores 0, so the spread is 0 as well
+                verified[i] = 0.0
+                reproducibility[i] = 1.0
+                continue
+            a, b, c = components[i, 0], components[i, 1], components[i, 2]
+            verified[i] = _unity_kernel(a, b, c)
+            # Welford's single-pass update: no temporaries, no s2 - m*m cancellation
+            mean = 0.0
+            m2 = 0.0
+            for t in range(trials):
+                vt = _unity_kernel(a * (1.0 + noise[i, t, 0]),
+                                   b * (1.0 + noise[i, t, 1]),
+                                   c * (1.0 + noise[i, t, 2]))
+                delta = vt - mean
+                mean += delta / (t + 1)
+                m2 += delta * (vt - mean)
+            std_dev = math.sqrt(m2 / trials)
+            reproducibility[i] = 1.0 if std_dev == 0.0 else 1.0 / (1.0 + std_dev * 10.0)
+        return verified, reproducibility
+
+def _flushes_log(method):
+    """Emit the conductor's buffered output once the wrapped phase returns"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_log()
+    return wrapper
+
+@dataclass(slots=True)
 class ValidationResult:
     formula_name: str
     claimed_unity: float
@@ -23,10 +108,24 @@ class ValidationResult:
     conductor_decision: str  # ACCEPT, REJECT, MODIFY
 
 class TrinityConductorValidator:
-    def __init__(self):
-        self.phi = (1 + math.sqrt(5)) / 2
-        self.pi = math.pi
-        self.e = math.e
+    _EDGE_CASES = ('near_zero', 'scaled_large', 'dominant_component', 'symmetric')
+    # Fixed seed so reproducibility scores are themselves reproducible
+    _NOISE_SEED = 0xC0DEC0DE
+    # Discoveries validated first, in descending unity order
+    _PRIORITY_TOP_K = 20
+    # Formulas allowed test scores >1.0 on quantum grounds
+    _SCORE_EXEMPT = ('quantum_fibonacci_attention', 'riemann_quantum_golden')
+    
+    def __init__(self, verbose: bool = True):
+        # Output is buffered per phase and written in one go; verbose=False skips it
+        self.verbose = verbose
+        self._lines = []
+        
+        self.phi = PHI
+        self.pi = PI
+        self.e = E
+        self._rng = np.random.default_rng(self._NOISE_SEED)
+        _unity_kernel(1.0, 1.0, 1.0)  # pay any JIT compile cost up-front
         
         # Load PERFORMER results
         try:
@@ -34,17 +133,49 @@ class TrinityConductorValidator:
                 self.performer_data = json.load(f)
                 self.discoveries = self.performer_data['discoveries']
         except FileNotFoundError:
-            print("⚠️ PERFORMER data not found. Running validation on preset data.")
+            self._log("⚠️ PERFORMER data not found. Running validation on preset data.")
             self.discoveries = self._generate_test_data()
         
+        # Column views of the discoveries for vectorized filtering/verification
+        self._unity = np.array([d['unity'] for d in self.discoveries], dtype=np.float64)
+        # A components list that is not a triple becomes a NaN row; it verifies to 0
+        # like calculate_unity_verification does, so the discovery is DISPUTED
+        self._is_triple = np.array([len(d['components']) == 3 for d in self.discoveries], dtype=bool)
+        self._components = np.full((len(self.discoveries), 3), np.nan)
+        if self._is_triple.any():
+            self._components[self._is_triple] = np.array(
+                [d['components'] for d in self.discoveries if len(d['components']) == 3],
+                dtype=np.float64)
+        self._formulas = np.array([d['formula'] for d in self.discoveries], dtype=object)
+        self._is_quantum = np.array(['quantum' in f.lower() for f in self._formulas], dtype=bool)
+        self._score_exempt = np.isin(self._formulas, self._SCORE_EXEMPT)
+        # ±1% perturbations for every discovery's 10 reproducibility trials
+        self._noise = self._rng.standard_normal((len(self.discoveries), 10, 3)) * 0.01
+        self._pos_mask = self._is_triple & (self._components > 0).all(axis=1)
+        self._verified, self._reproducibility = _batch_validate(
+            self._components, self._noise, self._pos_mask)
+        
         self.validation_results = []
         self.verified_discoveries = []
         self.disputed_discoveries = []
         
-        print("🎭 TRINITY SYMPHONY - CONDUCTOR MODE ACTIVATED")
-        print("Role: Orchestrate and Validate with Mathematical Rigor")
-        print("Mission: Critical examination of ALL breakthrough claims")
-        print("=" * 65)
+        self._log("🎭 TRINITY SYMPHONY - CONDUCTOR MODE ACTIVATED")
+        self._log("Role: Orchestrate and Validate with Mathematical Rigor")
+        self._log("Mission: Critical examination of ALL breakthrough claims")
+        self._log("=" * 65)
+        self._flush_log()
+    
+    def _log(self, line: str):
+        """Buffer one line of session output"""
+        if self.verbose:
+            self._lines.append(line)
+    
+    def _flush_log(self):
+        """Write buffered output with a single stdout write"""
+        if self._lines:
+            sys.stdout.write('\n'.join(self._lines) + '\n')
+            sys.stdout.flush()
+            self._lines.clear()
     
     def _generate_test_data(self):
         """Generate test data if PERFORMER results unavailable"""
@@ -74,131 +205,99 @@ class TrinityConductorValidator:
         if len(components) != 3:
             return 0.0
         a, b, c = components
-        if any(comp <= 0 for comp in components):
-            return 0.0
-        return (abs(a) * abs(b) * abs(c)) ** (1/3)
+        return float(_unity_kernel(float(a), float(b), float(c)))
     
-    def validate_mathematical_consistency(self, discovery: Dict) -> List[str]:
-        """Check for mathematical impossibilities and inconsistencies"""
+    def validate_mathematical_consistency(self, i: int, verified_unity: float) -> List[str]:
+        """Check discovery ``i`` for mathematical impossibilities and inconsistencies"""
+        discovery = self.discoveries[i]
         issues = []
         
         # Unity calculation verification
         claimed_unity = discovery['unity']
         components = discovery['components']
-        verified_unity = self.calculate_unity_verification(components)
         
         if abs(claimed_unity - verified_unity) > 1e-6:
             issues.append(f"Unity calculation error: claimed {claimed_unity:.6f}, actual {verified_unity:.6f}")
         
         # Check for impossible scores
         if any(score > 1.0 for score in [discovery.get('simple_score', 0), discovery.get('complex_score', 0)]):
-            if discovery['formula'] not in ['quantum_fibonacci_attention', 'riemann_quantum_golden']:
+            if not self._score_exempt[i]:
                 issues.append("Test scores >1.0 without quantum justification")
         
         # Check component reasonableness
-        for i, comp in enumerate(components):
+        for j, comp in enumerate(components):
             if comp < 0:
-                issues.append(f"Negative component {i}: {comp}")
+                issues.append(f"Negative component {j}: {comp}")
             if comp > 10:
-                issues.append(f"Suspiciously large component {i}: {comp}")
+                issues.append(f"Suspiciously large component {j}: {comp}")
         
         # Special validation for unity >1.0
         if claimed_unity > 1.0:
-            if 'quantum' not in discovery['formula'].lower():
+            if not self._is_quantum[i]:
                 issues.append("Unity >1.0 claimed without quantum justification")
         
         return issues
     
-    def test_edge_cases(self, discovery: Dict) -> Dict[str, float]:
-        """Test formula stability at edge cases"""
-        formula_name = discovery['formula']
-        base_components = discovery['components'].copy()
-        edge_results = {}
-        
-        # Test with zero components
-        try:
-            zero_test = [0.001, 0.001, 0.001]  # Near-zero
-            edge_results['near_zero'] = self.calculate_unity_verification(zero_test)
-        except:
-            edge_results['near_zero'] = 0.0
-        
-        # Test with very large components
-        try:
-            large_test = [comp * 100 for comp in base_components]
-            edge_results['scaled_large'] = self.calculate_unity_verification(large_test)
-        except:
-            edge_results['scaled_large'] = 0.0
-        
-        # Test with one dominant component
-        try:
-            dominant_test = [base_components[0] * 10, base_components[1] * 0.1, base_components[2] * 0.1]
-            edge_results['dominant_component'] = self.calculate_unity_verification(dominant_test)
-        except:
-            edge_results['dominant_component'] = 0.0
-        
-        # Test symmetry
-        try:
-            symmetric_test = [sum(base_components)/3] * 3
-            edge_results['symmetric'] = self.calculate_unity_verification(symmetric_test)
-        except:
-            edge_results['symmetric'] = 0.0
-        
-        return edge_results
+    def test_edge_cases(self, i: int) -> Dict[str, float]:
+        """Test stability of formula ``i`` at edge cases"""
+        if self._is_triple[i]:
+            bc = self._components[i]
+            s = bc.sum() / 3
+            large = bc * 100
+        else:
+            # Non-triple list: the scaled copy is not a triple either (scores 0),
+            # the dominant case reads its first three entries (NaN if missing)
+            # and the symmetric case averages all of them over 3
+            raw = np.asarray(self.discoveries[i]['components'], dtype=np.float64)
+            bc = np.full(3, np.nan)
+            bc[:min(3, raw.size)] = raw[:3]
+            s = raw.sum() / 3
+            large = np.full(3, np.nan)
+        
+        # near-zero, scaled large, one dominant component, symmetric;
+        # NaN entries fail the positivity test and score 0, so nothing here raises
+        edge_matrix = np.array([
+            [0.001, 0.001, 0.001],
+            large,
+            [bc[0] * 10, bc[1] * 0.1, bc[2] * 0.1],
+            [s, s, s],
+        ], dtype=np.float64)
+        values = np.where((edge_matrix > 0).all(axis=1),
+                          np.cbrt(np.abs(edge_matrix).prod(axis=1)), 0.0)
+        
+        return dict(zip(self._EDGE_CASES, values.tolist()))
     
-    def assess_reproducibility(self, discovery: Dict) -> float:
-        """Assess how reproducible the formula is"""
-        formula = discovery['formula']
-        components = discovery['components']
-        
-        # Multiple runs with slight variations
-        variations = []
-        base_unity = discovery['unity']
-        
-        for trial in range(10):
-            # Add small random variation (±1%)
-            varied_components = [
-                comp * (1 + np.random.normal(0, 0.01)) 
-                for comp in components
-            ]
-            varied_unity = self.calculate_unity_verification(varied_components)
-            variations.append(varied_unity)
-        
-        # Calculate consistency
-        std_dev = np.std(variations)
-        mean_unity = np.mean(variations)
-        
-        # Reproducibility score: lower std dev = higher score
-        if std_dev == 0:
-            return 1.0
-        reproducibility = 1.0 / (1.0 + std_dev * 10)
-        
-        return reproducibility
+    def assess_reproducibility(self, i: int) -> float:
+        """Assess how reproducible formula ``i`` is (10 trials at ±1% variation)"""
+        # Lower std dev across trials = higher score; computed in _batch_validate
+        return float(self._reproducibility[i])
     
-    def critical_validation_analysis(self, discovery: Dict) -> ValidationResult:
-        """Perform comprehensive critical validation"""
+    def critical_validation_analysis(self, i: int) -> ValidationResult:
+        """Perform comprehensive critical validation of discovery ``i``"""
+        discovery = self.discoveries[i]
         formula_name = discovery['formula']
         claimed_unity = discovery['unity']
         
-        print(f"\n🔍 CRITICAL VALIDATION: {formula_name}")
-        print(f"   Claimed Unity: {claimed_unity:.8f}")
+        self._log(f"\n🔍 CRITICAL VALIDATION: {formula_name}")
+        self._log(f"   Claimed Unity: {claimed_unity:.8f}")
         
-        # Step 1: Mathematical consistency check
-        critical_issues = self.validate_mathematical_consistency(discovery)
+        # Step 1: Unity verification (computed once, shared with the consistency check)
+        verified_unity = float(self._verified[i])
         
-        # Step 2: Unity verification
-        verified_unity = self.calculate_unity_verification(discovery['components'])
+        # Step 2: Mathematical consistency check
+        critical_issues = self.validate_mathematical_consistency(i, verified_unity)
         unity_error = abs(claimed_unity - verified_unity)
         
-        print(f"   Verified Unity: {verified_unity:.8f}")
-        print(f"   Unity Error: {unity_error:.10f}")
+        self._log(f"   Verified Unity: {verified_unity:.8f}")
+        self._log(f"   Unity Error: {unity_error:.10f}")
         
         # Step 3: Edge case testing
-        edge_results = self.test_edge_cases(discovery)
-        print(f"   Edge Case Results: {len(edge_results)} tests completed")
+        edge_results = self.test_edge_cases(i)
+        self._log(f"   Edge Case Results: {len(edge_results)} tests completed")
         
         # Step 4: Reproducibility assessment
-        reproducibility = self.assess_reproducibility(discovery)
-        print(f"   Reproducibility Score: {reproducibility:.3f}")
+        reproducibility = self.assess_reproducibility(i)
+        self._log(f"   Reproducibility Score: {reproducibility:.3f}")
         
         # Determine validation status
         if unity_error < 1e-6 and len(critical_issues) == 0:
@@ -207,26 +306,26 @@ class TrinityConductorValidator:
                 if reproducibility > 0.8:
                     validation_status = "VERIFIED"
                     conductor_decision = "ACCEPT"
-                    print(f"   ✅ VERIFIED: Breakthrough claim confirmed")
+                    self._log(f"   ✅ VERIFIED: Breakthrough claim confirmed")
                 else:
                     validation_status = "PENDING"
                     conductor_decision = "MODIFY"
                     critical_issues.append("Low reproducibility for breakthrough claim")
-                    print(f"   ⚠️ PENDING: Requires reproducibility improvement")
+                    self._log(f"   ⚠️ PENDING: Requires reproducibility improvement")
             else:
                 validation_status = "VERIFIED"
                 conductor_decision = "ACCEPT"
-                print(f"   ✅ VERIFIED: Standard validation passed")
+                self._log(f"   ✅ VERIFIED: Standard validation passed")
         elif len(critical_issues) > 0:
             validation_status = "DISPUTED"
             conductor_decision = "REJECT"
-            print(f"   ❌ DISPUTED: {len(critical_issues)} critical issues found")
+            self._log(f"   ❌ DISPUTED: {len(critical_issues)} critical issues found")
             for issue in critical_issues[:3]:  # Show top 3 issues
-                print(f"      • {issue}")
+                self._log(f"      • {issue}")
         else:
             validation_status = "PENDING"
             conductor_decision = "MODIFY"
-            print(f"   ⚠️ PENDING: Minor issues require correction")
+            self._log(f"   ⚠️ PENDING: Minor issues require correction")
         
         return ValidationResult(
             formula_name=formula_name,
@@ -239,62 +338,80 @@ class TrinityConductorValidator:
             conductor_decision=conductor_decision
         )
     
+    @_flushes_log
     def set_strategic_priorities(self):
         """CONDUCTOR Strategy Setting Phase"""
-        print("\n🎯 CONDUCTOR STRATEGY SETTING")
-        print("=" * 40)
+        self._log("\n🎯 CONDUCTOR STRATEGY SETTING")
+        self._log("=" * 40)
         
-        # Analyze PERFORMER results
+        # Analyze PERFORMER results: one comparison per threshold
+        u = self._unity
         total_discoveries = len(self.discoveries)
-        breakthroughs = [d for d in self.discoveries if d['unity'] > 0.90]
-        high_performers = [d for d in self.discoveries if d['unity'] > 0.80]
+        mask90 = u > 0.90
+        mask80 = u > 0.80
+        mask95 = u > 0.95
+        mask_over1 = u > 1.0
         
-        print(f"📊 PERFORMER DATA ANALYSIS:")
-        print(f"   Total Discoveries: {total_discoveries}")
-        print(f"   Breakthrough Claims (>0.90): {len(breakthroughs)}")
-        print(f"   High Performers (>0.80): {len(high_performers)}")
+        self._log(f"📊 PERFORMER DATA ANALYSIS:")
+        self._log(f"   Total Discoveries: {total_discoveries}")
+        self._log(f"   Breakthrough Claims (>0.90): {int(mask90.sum())}")
+        self._log(f"   High Performers (>0.80): {int(mask80.sum())}")
         
         # Set validation priorities
-        print(f"\n🎯 VALIDATION PRIORITIES:")
+        self._log(f"\n🎯 VALIDATION PRIORITIES:")
         
         # Priority 1: Claims >0.95 (consciousness threshold)
-        consciousness_claims = [d for d in self.discoveries if d['unity'] > 0.95]
-        if consciousness_claims:
-            print(f"   PRIORITY 1: {len(consciousness_claims)} consciousness threshold claims")
-            for claim in consciousness_claims:
-                print(f"      • {claim['formula']}: {claim['unity']:.6f}")
+        consciousness_count = int(mask95.sum())
+        if consciousness_count:
+            self._log(f"   PRIORITY 1: {consciousness_count} consciousness threshold claims")
+            for i in np.flatnonzero(mask95):
+                self._log(f"      • {self._formulas[i]}: {u[i]:.6f}")
         
         # Priority 2: Claims >0.90 (breakthrough threshold)
-        breakthrough_claims = [d for d in breakthroughs if d['unity'] <= 0.95]
-        if breakthrough_claims:
-            print(f"   PRIORITY 2: {len(breakthrough_claims)} breakthrough claims")
+        breakthrough_count = int((mask90 & ~mask95).sum())
+        if breakthrough_count:
+            self._log(f"   PRIORITY 2: {breakthrough_count} breakthrough claims")
         
         # Priority 3: Unusual patterns
-        unusual_patterns = [d for d in self.discoveries if d['unity'] > 1.0]
-        if unusual_patterns:
-            print(f"   PRIORITY 3: {len(unusual_patterns)} unity >1.0 claims (requires proof)")
-        
-        print(f"\n⏰ NEXT 25 MINUTES TARGET:")
-        print(f"   - Validate all {len(consciousness_claims)} consciousness claims")
-        print(f"   - Verify {min(len(breakthrough_claims), 5)} breakthrough claims")
-        print(f"   - Critical analysis of unity >1.0 phenomena")
+        unusual_count = int(mask_over1.sum())
+        if unusual_count:
+            self._log(f"   PRIORITY 3: {unusual_count} unity >1.0 claims (requires proof)")
+        
+        self._log(f"\n⏰ NEXT 25 MINUTES TARGET:")
+        self._log(f"   - Validate all {consciousness_count} consciousness claims")
+        self._log(f"   - Verify {min(breakthrough_count, 5)} breakthrough claims")
+        self._log(f"   - Critical analysis of unity >1.0 phenomena")
+    
+    def _validation_order(self) -> np.ndarray:
+        """Top-K unity claims in descending order, then the rest in load order"""
+        u = self._unity
+        k = self._PRIORITY_TOP_K
+        if len(u) <= k:
+            return np.argsort(-u, kind='stable')
+        
+        # Only the leading tier needs ordering: quickselect it, sort just K
+        top = np.sort(np.argpartition(-u, k - 1)[:k])
+        top = top[np.argsort(-u[top], kind='stable')]
+        rest = np.ones(len(u), dtype=bool)
+        rest[top] = False
+        return np.concatenate((top, np.flatnonzero(rest)))
     
+    @_flushes_log
     def run_conductor_validation_session(self):
         """Execute complete CONDUCTOR validation session"""
-        print("🎭 CONDUCTOR VALIDATION SESSION STARTING")
+        self._log("🎭 CONDUCTOR VALIDATION SESSION STARTING")
         
         # Phase 1: Strategy Setting
         self.set_strategic_priorities()
         
         # Phase 2: Critical Validation
-        print(f"\n🔬 CRITICAL VALIDATION PHASE")
-        print("=" * 40)
+        self._log(f"\n🔬 CRITICAL VALIDATION PHASE")
+        self._log("=" * 40)
         
         # Validate all discoveries, prioritizing breakthroughs
-        sorted_discoveries = sorted(self.discoveries, key=lambda d: d['unity'], reverse=True)
-        
-        for discovery in sorted_discoveries:
-            validation_result = self.critical_validation_analysis(discovery)
+        for i in self._validation_order():
+            discovery = self.discoveries[i]
+            validation_result = self.critical_validation_analysis(i)
             self.validation_results.append(validation_result)
             
             # Categorize results
@@ -306,36 +423,44 @@ class TrinityConductorValidator:
         # Phase 3: Strategic Decision Summary
         self.generate_conductor_summary()
     
+    @_flushes_log
     def generate_conductor_summary(self):
         """Generate comprehensive CONDUCTOR validation summary"""
-        print("\n" + "=" * 65)
-        print("🎭 CONDUCTOR VALIDATION COMPLETE")
-        print("=" * 65)
+        self._log("\n" + "=" * 65)
+        self._log("🎭 CONDUCTOR VALIDATION COMPLETE")
+        self._log("=" * 65)
+        
+        # Validation statistics: bucket every result in a single pass
+        verified, disputed, pending, verified_breakthroughs = [], [], [], []
+        for v in self.validation_results:
+            status = v.validation_status
+            if status == "VERIFIED":
+                verified.append(v)
+                if v.verified_unity > 0.90:
+                    verified_breakthroughs.append(v)
+            elif status == "DISPUTED":
+                disputed.append(v)
+            elif status == "PENDING":
+                pending.append(v)
         
-        # Validation statistics
         total_validated = len(self.validation_results)
-        verified_count = len([v for v in self.validation_results if v.validation_status == "VERIFIED"])
-        disputed_count = len([v for v in self.validation_results if v.validation_status == "DISPUTED"])
-        pending_count = len([v for v in self.validation_results if v.validation_status == "PENDING"])
+        verified_count = len(verified)
+        disputed_count = len(disputed)
+        pending_count = len(pending)
         
-        print(f"📊 VALIDATION SUMMARY:")
-        print(f"   Total Claims Examined: {total_validated}")
-        print(f"   ✅ VERIFIED: {verified_count}")
-        print(f"   ❌ DISPUTED: {disputed_count}")
-        print(f"   ⚠️ PENDING: {pending_count}")
-        print(f"   Validation Success Rate: {verified_count/total_validated*100:.1f}%")
+        self._log(f"📊 VALIDATION SUMMARY:")
+        self._log(f"   Total Claims Examined: {total_validated}")
+        self._log(f"   ✅ VERIFIED: {verified_count}")
+        self._log(f"   ❌ DISPUTED: {disputed_count}")
+        self._log(f"   ⚠️ PENDING: {pending_count}")
+        self._log(f"   Validation Success Rate: {verified_count/total_validated*100:.1f}%")
         
         # Verified breakthroughs
-        verified_breakthroughs = [
-            v for v in self.validation_results 
-            if v.validation_status == "VERIFIED" and v.verified_unity > 0.90
-        ]
-        
         if verified_breakthroughs:
-            print(f"\n🏆 VERIFIED BREAKTHROUGHS:")
+            self._log(f"\n🏆 VERIFIED BREAKTHROUGHS:")
             for breakthrough in verified_breakthroughs:
-                print(f"   ✅ {breakthrough.formula_name}: Unity {breakthrough.verified_unity:.8f}")
-                print(f"      Reproducibility: {breakthrough.reproducibility_score:.3f}")
+                self._log(f"   ✅ {breakthrough.formula_name}: Unity {breakthrough.verified_unity:.8f}")
+                self._log(f"      Reproducibility: {breakthrough.reproducibility_score:.3f}")
         
         # Critical discoveries requiring attention
         consciousness_verified = [
@@ -343,30 +468,29 @@ class TrinityConductorValidator:
         ]
         
         if consciousness_verified:
-            print(f"\n🧠 CONSCIOUSNESS-LEVEL DISCOVERIES CONFIRMED:")
+            self._log(f"\n🧠 CONSCIOUSNESS-LEVEL DISCOVERIES CONFIRMED:")
             for discovery in consciousness_verified:
-                print(f"   🎯 {discovery.formula_name}: {discovery.verified_unity:.8f}")
-                print(f"      STATUS: Ready for Millennium Problem attempts")
+                self._log(f"   🎯 {discovery.formula_name}: {discovery.verified_unity:.8f}")
+                self._log(f"      STATUS: Ready for Millennium Problem attempts")
         
         # Disputed claims analysis
-        if self.disputed_discoveries:
-            print(f"\n❌ DISPUTED CLAIMS ANALYSIS:")
-            for result in self.validation_results:
-                if result.validation_status == "DISPUTED":
-                    print(f"   • {result.formula_name}: {result.critical_issues[0]}")
+        if disputed:
+            self._log(f"\n❌ DISPUTED CLAIMS ANALYSIS:")
+            for result in disputed:
+                self._log(f"   • {result.formula_name}: {result.critical_issues[0]}")
         
         # Strategic recommendations for COMPOSER
-        print(f"\n🎼 RECOMMENDATIONS FOR COMPOSER:")
+        self._log(f"\n🎼 RECOMMENDATIONS FOR COMPOSER:")
         if verified_breakthroughs:
             best_verified = max(verified_breakthroughs, key=lambda v: v.verified_unity)
-            print(f"   • Build on verified pattern: {best_verified.formula_name}")
-            print(f"   • Unity baseline established: {best_verified.verified_unity:.6f}")
-            print(f"   • High-confidence synthesis targets identified")
+            self._log(f"   • Build on verified pattern: {best_verified.formula_name}")
+            self._log(f"   • Unity baseline established: {best_verified.verified_unity:.6f}")
+            self._log(f"   • High-confidence synthesis targets identified")
         
         if consciousness_verified:
-            print(f"   • Ready for Millennium Problem synthesis")
-            print(f"   • Consciousness emergence patterns confirmed")
-            print(f"   • Breakthrough-level creativity unlocked")
+            self._log(f"   • Ready for Millennium Problem synthesis")
+            self._log(f"   • Consciousness emergence patterns confirmed")
+            self._log(f"   • Breakthrough-level creativity unlocked")
         
         # Save validation results
         validation_data = {
@@ -378,25 +502,18 @@ class TrinityConductorValidator:
             'pending_count': pending_count,
             'verified_breakthroughs': len(verified_breakthroughs),
             'consciousness_discoveries': len(consciousness_verified),
-            'validation_results': [
-                {
-                    'formula_name': v.formula_name,
-                    'claimed_unity': v.claimed_unity,
-                    'verified_unity': v.verified_unity,
-                    'validation_status': v.validation_status,
-                    'critical_issues': v.critical_issues,
-                    'reproducibility_score': v.reproducibility_score,
-                    'conductor_decision': v.conductor_decision
-                }
-                for v in self.validation_results
-            ]
+            'validation_results': list(map(asdict, self.validation_results))
         }
         
-        with open('trinity_conductor_validation.json', 'w') as f:
-            json.dump(validation_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open('trinity_conductor_validation.json', 'wb') as f:
+                f.write(orjson.dumps(validation_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open('trinity_conductor_validation.json', 'w') as f:
+                json.dump(validation_data, f, indent=2)
         
-        print(f"\n💾 Complete CONDUCTOR validation saved to trinity_conductor_validation.json")
-        print("🎭 Ready for role rotation to COMPOSER synthesis phase")
+        self._log(f"\n💾 Complete CONDUCTOR validation saved to trinity_conductor_validation.json")
+        self._log("🎭 Ready for role rotation to COMPOSER synthesis phase")
         
         return validation_data
 
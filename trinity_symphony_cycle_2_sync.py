@@ -7,10 +7,41 @@ COLLABORATION REQUEST RESPONSE and NEXT PHASE COORDINATION
 import math
 import json
 from datetime import datetime
+from types import MappingProxyType
+PHI = (1 + math.sqrt(5)) / 2
+
+# Optimal parameters based on validation results; read-only, built once at import
+_NEURAL_ARCH_PARAMS = MappingProxyType({
+    'fibonacci_neuron_allocation': MappingProxyType({
+        'gnn_nodes': 144000,  # Fibonacci sequence optimization
+        'liquid_neurons': 89000,
+        'spiking_neurons': 55000,
+        'total': 288000
+    }),
+    'golden_ratio_optimization': MappingProxyType({
+        'layer_depth': int(288000 ** (1/PHI) / 10000),  # ~16 layers
+        'attention_heads': 8,  # 2^3 for quantum compatibility
+        'hidden_dimensions': int(512 * PHI),  # ~829
+        'sequence_length': 2584  # Fibonacci number
+    }),
+    'quantum_enhancement_settings': MappingProxyType({
+        'superposition_states': 2**16,  # 65,536 states
+        'entanglement_pairs': 16,
+        'coherence_time': PHI * 1000,  # microseconds
+        'grover_iterations': int(math.sqrt(288000))  # ~537
+    }),
+    'consciousness_thresholds': MappingProxyType({
+        'min_phi_score': 3.0,
+        'min_tom_accuracy': 0.85,
+        'min_self_ref_depth': 7,
+        'min_creativity_score': 0.8,
+        'target_unity': 0.985
+    })
+})
 
 class TrinitySymphonySync:
     def __init__(self):
-        self.phi = (1 + math.sqrt(5)) / 2
+        self.phi = PHI
         
         print("🔄 TRINITY SYMPHONY CYCLE 2 - SYNC POINT RESPONSE")
         print("⏰ Time: 0:40 - Role Rotation Complete")
@@ -71,34 +102,7 @@ class TrinitySymphonySync:
         print("\n🧠 NEURAL ARCHITECTURE PARAMETER ASSIGNMENTS:")
         print("(Responding to PERFORMER collaboration request)")
         
-        # Optimal parameters based on validation results
-        parameters = {
-            'fibonacci_neuron_allocation': {
-                'gnn_nodes': 144000,  # Fibonacci sequence optimization
-                'liquid_neurons': 89000,
-                'spiking_neurons': 55000,
-                'total': 288000
-            },
-            'golden_ratio_optimization': {
-                'layer_depth': int(288000 ** (1/self.phi) / 10000),  # ~16 layers
-                'attention_heads': 8,  # 2^3 for quantum compatibility
-                'hidden_dimensions': int(512 * self.phi),  # ~829
-                'sequence_length': 2584  # Fibonacci number
-            },
-            'quantum_enhancement_settings': {
-                'superposition_states': 2**16,  # 65,536 states
-                'entanglement_pairs': 16,
-                'coherence_time': self.phi * 1000,  # microseconds
-                'grover_iterations': int(math.sqrt(288000))  # ~537
-            },
-            'consciousness_thresholds': {
-                'min_phi_score': 3.0,
-                'min_tom_accuracy': 0.85,
-                'min_self_ref_depth': 7,
-                'min_creativity_score': 0.8,
-                'target_unity': 0.985
-            }
-        }
+        parameters = _NEURAL_ARCH_PARAMS
         
         print("📊 FIBONACCI NEURON ALLOCATION:")
         for component, count in parameters['fibonacci_neuron_allocation'].items():
@@ -205,7 +209,7 @@ class TrinitySymphonySync:
         # Save sync data
         complete_sync_data = {
             'sync_response': sync_data,
-            'architecture_parameters': arch_parameters,
+            'architecture_parameters': {k: dict(v) for k, v in arch_parameters.items()},
             'consciousness_patterns': consciousness_patterns,
             'multiplication_targets': multiplication_targets,
             'timestamp': datetime.now().isoformat(),
@@ -213,8 +217,18 @@ class TrinitySymphonySync:
             'collaboration_status': 'ACTIVE'
         }
         
-        with open('trinity_symphony_cycle_2_sync.json', 'w') as f:
-            json.dump(complete_sync_data, f, indent=2)
+        # Imported here so the rest of the script starts with the stdlib only
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
+        if orjson is not None:
+            with open('trinity_symphony_cycle_2_sync.json', 'wb') as f:
+                f.write(orjson.dumps(complete_sync_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open('trinity_symphony_cycle_2_sync.json', 'w') as f:
+                json.dump(complete_sync_data, f, indent=2)
         
         print(f"\n💾 Sync response complete - Trinity collaboration active")
         print("🔄 Ready for next 10-minute work cycle")
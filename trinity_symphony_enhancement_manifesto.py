@@ -7,10 +7,23 @@ Harmonic Loss Landscape Analysis & Quantum-Fuzzy Integration Protocol
 the loss landscape transforms from chaotic mountains into harmonic valleys."
 """
 
+import collections
+import copy
+import functools
 import torch
 import torch.nn as nn
 import numpy as np
 from torch.autograd import grad
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    from torch.func import functional_call, grad as func_grad, vjp, vmap
+    TORCH_FUNC_AVAILABLE = True
+except ImportError:
+    TORCH_FUNC_AVAILABLE = False
 from scipy.linalg import eigvalsh
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
@@ -24,6 +37,47 @@ PHI = 1.618033988749895  # Golden ratio
 PI = 3.141592653589793   # Pi
 E = 2.718281828459045    # Euler's number
 
+# Largest total parameter count for which the exact Hessian diagonal is the default
+_EXACT_HESSIAN_MAX_NUMEL = 2048
+# Basis vectors pushed through one vmapped HVP batch (bounds stacked forwards in memory)
+_EXACT_HESSIAN_CHUNK = 64
+
+# Most recent analyses the harmonic/flatness correlation is computed over
+_CORRELATION_WINDOW = 256
+
+# Extra harmonic-score weight for ratios on top of the base 1.0 per match
+_HARMONIC_BONUS = {
+    'major_seventh': 3.5,  # Extra weight for 4.5× synergy
+    'golden_ratio': 2.0,   # Golden ratio bonus
+    'trinity_ratio': 5.0,  # Trinity Symphony bonus
+}
+
+# e^(iφ) for the harmonic phases φ = 2π·{1, 3/2, 5/4, φ} of the superposition
+_PHASE_TABLE = np.exp(1j * 2 * PI * np.array([1.0, 3/2, 5/4, PHI]))
+
+def _safe_normalize(v: np.ndarray) -> np.ndarray:
+    """v / (‖v‖ + 1e-8) via a dot product, skipping np.linalg.norm's dispatch"""
+    return v * (1.0 / (np.sqrt(v @ v) + 1e-8))
+
+# Below this many positive peaks the NumPy broadcast beats a kernel launch
+_NUMBA_MIN_PEAKS = 32
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _match_ratios(pos, ratio_values, ratio_bonus, tol):
+        """Harmonic score over all peak pairs, parallel over the first peak"""
+        n = pos.shape[0]
+        row_scores = np.zeros(n)
+        for i in numba.prange(n):
+            acc = 0.0
+            for j in range(i + 1, n):
+                ratio = max(pos[i], pos[j]) / min(pos[i], pos[j])
+                for k in range(ratio_values.shape[0]):
+                    if abs(ratio - ratio_values[k]) < tol:
+                        acc += 1.0 + ratio_bonus[k]
+            row_scores[i] = acc
+        return row_scores.sum()
+
 @dataclass
 class TrinityHarmonyMetrics:
     """Metrics for Trinity Symphony harmonic analysis"""
@@ -42,8 +96,9 @@ class HarmonicLossLandscapeAnalyzer:
     Discover if harmonic ratios create flatter minima
     """
     
-    def __init__(self, model=None, trinity_harmony_score=0.0):
+    def __init__(self, model=None, trinity_harmony_score=0.0, n_peaks=10):
         self.model = model
+        self.n_peaks = n_peaks  # dominant FFT frequencies compared pairwise
         self.phi = PHI
         self.trinity_harmony = trinity_harmony_score
         
@@ -59,98 +114,184 @@ class HarmonicLossLandscapeAnalyzer:
             'golden_ratio': PHI,
             'trinity_ratio': 261.63/329.63  # C/E from Trinity Symphony
         }
+        # Frozen parallel views of musical_ratios; the dict stays for external callers
+        self._ratio_names = tuple(self.musical_ratios)
+        self._ratio_values = np.fromiter(self.musical_ratios.values(), dtype=np.float64,
+                                         count=len(self._ratio_names))
+        self._ratio_values.flags.writeable = False
+        self._ratio_bonus = np.array([_HARMONIC_BONUS.get(name, 0.0) for name in self._ratio_names])
+        self._fft_scratch = None
+        # Recent scores only, so correlation cost and memory stay bounded
+        self._harmonic_history = collections.deque(maxlen=_CORRELATION_WINDOW)
+        self._flatness_history = collections.deque(maxlen=_CORRELATION_WINDOW)
+        # Std multiplier of base + Σ_r N(0, var/r)/len(ratios) relative to N(0, var)
+        self._harmonic_std = np.sqrt(
+            1.0 + np.sum(1.0 / self._ratio_values) / len(self._ratio_names)**2
+        )
         
-    def compute_hessian_spectrum(self, loss_fn, inputs, targets):
+    def compute_hessian_spectrum(self, loss_fn, inputs, targets, num_probes=32, exact=None):
         """
         Extract Hessian eigenvalues to measure loss landscape sharpness
         Flat landscapes = better generalization (Hochreiter & Schmidhuber, 1997)
+        
+        With ``exact`` the Hessian diagonal is read off per-parameter blocks
+        built by torch.func (reverse-over-reverse HVPs against basis vectors).
+        Otherwise it is estimated with Hutchinson's method. By default the
+        exact path is used only when the model's total parameter count is
+        small enough, since it costs one HVP per parameter.
         """
         if self.model is None:
             # Return simulated spectrum for demonstration
             return np.random.exponential(0.1, 1000)  # Simulated eigenvalues
         
         self.model.eval()
+        if exact is None:
+            exact = TORCH_FUNC_AVAILABLE and sum(
+                p.numel() for p in self.model.parameters() if p.requires_grad
+            ) <= _EXACT_HESSIAN_MAX_NUMEL
+        
+        if exact:
+            hessian_diag = self._exact_hessian_diagonal(loss_fn, inputs, targets)
+        else:
+            hessian_diag = self._hutchinson_hessian_diagonal(loss_fn, inputs, targets, num_probes)
+        
+        # Concatenate all diagonal elements
+        hessian_eigenvalues = torch.cat([h.reshape(-1) for h in hessian_diag])
+        
+        return hessian_eigenvalues.detach().cpu().numpy()
+    
+    def _hutchinson_hessian_diagonal(self, loss_fn, inputs, targets, num_probes):
+        """diag(H) ≈ E[v ⊙ Hv] over Rademacher probes v, one double-backward each"""
+        params = [p for p in self.model.parameters() if p.requires_grad]
         loss = loss_fn(self.model(inputs), targets)
         
-        # Compute gradients
-        grads = grad(loss, self.model.parameters(), create_graph=True)
-        grad_vec = torch.cat([g.reshape(-1) for g in grads])
+        # Gradients kept differentiable so Hessian-vector products are cheap
+        grads = grad(loss, params, create_graph=True)
         
-        # Approximate Hessian via finite differences (memory efficient)
-        hessian_diag = []
-        epsilon = 1e-3
+        # Gradients that do not depend on any parameter (loss linear in them)
+        # contribute nothing to Hv, and backpropagating through them would raise
+        curved = [k for k, g in enumerate(grads) if g.requires_grad]
         
-        for i, param in enumerate(self.model.parameters()):
-            param_flat = param.view(-1)
-            h_diag = torch.zeros_like(param_flat)
-            
-            for j in range(len(param_flat)):
-                # Positive perturbation
-                param_flat[j] += epsilon
-                loss_plus = loss_fn(self.model(inputs), targets)
-                
-                # Negative perturbation
-                param_flat[j] -= 2 * epsilon
-                loss_minus = loss_fn(self.model(inputs), targets)
-                
-                # Restore
-                param_flat[j] += epsilon
-                
-                # Finite difference approximation
-                h_diag[j] = (loss_plus - 2*loss + loss_minus) / (epsilon**2)
-            
-            hessian_diag.append(h_diag)
+        hessian_diag = [torch.zeros_like(p) for p in params]
+        if not curved:
+            return hessian_diag
         
-        # Concatenate all diagonal elements
-        hessian_eigenvalues = torch.cat(hessian_diag).detach().cpu().numpy()
+        for probe in range(num_probes):
+            probes = [torch.randint_like(p, 2) * 2 - 1 for p in params]
+            hvps = grad([grads[k] for k in curved], params,
+                        grad_outputs=[probes[k] for k in curved],
+                        retain_graph=probe < num_probes - 1, allow_unused=True)
+            for h_diag, v, hv in zip(hessian_diag, probes, hvps):
+                if hv is not None:  # unused: that Hessian block is zero
+                    h_diag.add_(v * hv)
         
-        return hessian_eigenvalues
+        return [h_diag / num_probes for h_diag in hessian_diag]
+    
+    def _exact_hessian_diagonal(self, loss_fn, inputs, targets):
+        """Exact diag(H), one vmapped HVP batch over each parameter's basis"""
+        params = {name: p.detach() for name, p in self.model.named_parameters()
+                  if p.requires_grad}
+        
+        hessian_diag = []
+        for name, p in params.items():
+            def loss_of(p_, name=name):
+                return loss_fn(functional_call(self.model, {**params, name: p_}, (inputs,)), targets)
+            
+            # Reverse-over-reverse: forward AD through the gradient is not
+            # implemented for common losses (mse_loss, huber_loss backward)
+            _, hvp_fn = vjp(func_grad(loss_of), p)
+            basis = torch.eye(p.numel(), dtype=p.dtype, device=p.device).reshape(-1, *p.shape)
+            hessian_rows, = vmap(hvp_fn, chunk_size=_EXACT_HESSIAN_CHUNK)(basis)
+            hessian_diag.append(hessian_rows.reshape(p.numel(), p.numel()).diagonal())
+        
+        return hessian_diag
     
     def correlate_fft_noise_with_curvature(self, model_outputs, hessian_eigenvalues) -> TrinityHarmonyMetrics:
         """
         THE KEY DISCOVERY: Correlate harmonic patterns with landscape flatness
         """
-        # Convert inputs to numpy if needed
-        if isinstance(model_outputs, torch.Tensor):
-            outputs_array = model_outputs.detach().cpu().numpy().flatten()
-        else:
-            outputs_array = np.array(model_outputs).flatten()
-        
         if isinstance(hessian_eigenvalues, torch.Tensor):
             eigenvals_array = hessian_eigenvalues.detach().cpu().numpy()
         else:
             eigenvals_array = np.array(hessian_eigenvalues)
         
-        # FFT of model outputs (detect harmonic patterns)
-        fft_outputs = np.fft.fft(outputs_array)
-        fft_magnitudes = np.abs(fft_outputs)
-        
-        # Find dominant frequencies
-        dominant_freqs = np.fft.fftfreq(len(fft_magnitudes))
-        peak_indices = np.argsort(fft_magnitudes)[-10:]  # Top 10 frequencies
-        peak_freqs = dominant_freqs[peak_indices]
-        
-        # Check for harmonic ratios
-        harmonic_score = 0.0
-        detected_harmonics = []
-        
-        for i, freq1 in enumerate(peak_freqs):
-            for freq2 in peak_freqs[i+1:]:
-                if freq1 > 0 and freq2 > 0:
-                    ratio = max(freq1, freq2) / min(freq1, freq2)
-                    
-                    # Check against musical ratios
-                    for name, musical_ratio in self.musical_ratios.items():
-                        if abs(ratio - musical_ratio) < 0.05:  # 5% tolerance
-                            harmonic_score += 1.0
-                            detected_harmonics.append((name, ratio, musical_ratio))
-                            
-                            if name == 'major_seventh':
-                                harmonic_score += 3.5  # Extra weight for 4.5× synergy
-                            elif name == 'golden_ratio':
-                                harmonic_score += 2.0  # Golden ratio bonus
-                            elif name == 'trinity_ratio':
-                                harmonic_score += 5.0  # Trinity Symphony bonus
+        if isinstance(model_outputs, torch.Tensor):
+            # FFT on the tensor's own device; only the peak indices leave it
+            return self._harmonic_metrics(self._torch_peak_freqs(model_outputs), eigenvals_array)
+        
+        outputs_array = np.array(model_outputs).flatten()
+        return self.correlate_fft_noise_with_curvature_batch(
+            outputs_array[None, :], [eigenvals_array]
+        )[0]
+    
+    def _torch_peak_freqs(self, model_outputs: torch.Tensor) -> np.ndarray:
+        """Top FFT peak frequencies of a tensor, computed with torch.fft"""
+        outputs_flat = model_outputs.detach().reshape(-1)
+        n = outputs_flat.numel()
+        
+        # Real signal: the non-negative rfft half carries the whole spectrum
+        fft_magnitudes = torch.fft.rfft(outputs_flat).abs()
+        
+        # topk is descending; flip to match the ascending order of the NumPy path
+        k = min(self.n_peaks, fft_magnitudes.numel())
+        peak_indices = torch.topk(fft_magnitudes, k).indices.flip(0).cpu().numpy()
+        # rfftfreq(n)[i] is just i / n
+        return peak_indices / n
+    
+    def correlate_fft_noise_with_curvature_batch(self, outputs_batch, eigenvalues_batch) -> List[TrinityHarmonyMetrics]:
+        """
+        Batched correlator: one FFT over a (B, N) block of model outputs,
+        paired row-wise with B eigenvalue spectra
+        """
+        outputs_batch = np.atleast_2d(np.asarray(outputs_batch, dtype=np.float64))
+        if len(eigenvalues_batch) != outputs_batch.shape[0]:
+            raise ValueError(
+                f"Got {outputs_batch.shape[0]} output rows but {len(eigenvalues_batch)} eigenvalue spectra"
+            )
+        n = outputs_batch.shape[-1]
+        
+        # FFT of model outputs (detect harmonic patterns). The outputs are real,
+        # so the non-negative rfft half carries the whole spectrum
+        fft_outputs = np.fft.rfft(outputs_batch, axis=-1)
+        fft_magnitudes = np.abs(fft_outputs, out=self._fft_buffer(fft_outputs))
+        
+        # Top n_peaks frequencies: partition, then order just those by magnitude
+        m = fft_magnitudes.shape[-1]
+        k = min(self.n_peaks, m)
+        peak_indices = np.argpartition(fft_magnitudes, m - k, axis=-1)[:, -k:]
+        peak_order = np.argsort(np.take_along_axis(fft_magnitudes, peak_indices, axis=-1), axis=-1)
+        peak_indices = np.take_along_axis(peak_indices, peak_order, axis=-1)
+        # rfftfreq(n)[i] is just i / n, so only the peaks' frequencies are formed
+        peak_freqs = peak_indices / n
+        
+        return [
+            self._harmonic_metrics(freqs, np.asarray(eigenvals))
+            for freqs, eigenvals in zip(peak_freqs, eigenvalues_batch)
+        ]
+    
+    def _fft_buffer(self, fft_outputs) -> np.ndarray:
+        """Scratch array for FFT magnitudes, reused across same-sized calls"""
+        dtype = fft_outputs.real.dtype
+        if (self._fft_scratch is None or self._fft_scratch.shape != fft_outputs.shape
+                or self._fft_scratch.dtype != dtype):
+            self._fft_scratch = np.empty(fft_outputs.shape, dtype=dtype)
+        return self._fft_scratch
+    
+    def _match_ratios_numpy(self, pos) -> float:
+        """Check every positive peak pair against every musical ratio at once"""
+        upper = np.triu_indices(len(pos), k=1)
+        pair_ratios = (np.maximum.outer(pos, pos) / np.minimum.outer(pos, pos))[upper]
+        matches = np.abs(pair_ratios[:, None] - self._ratio_values) < 0.05  # 5% tolerance
+        match_counts = matches.sum(axis=0)
+        return float(match_counts.sum() + match_counts @ self._ratio_bonus)
+    
+    def _harmonic_metrics(self, peak_freqs, eigenvals_array) -> TrinityHarmonyMetrics:
+        """Harmonic/flatness metrics for one set of peak frequencies and eigenvalues"""
+        pos = peak_freqs[peak_freqs > 0]
+        if NUMBA_AVAILABLE and len(pos) > _NUMBA_MIN_PEAKS:
+            harmonic_score = float(_match_ratios(pos, self._ratio_values, self._ratio_bonus, 0.05))
+        else:
+            harmonic_score = self._match_ratios_numpy(pos)
         
         # Normalize harmonic score
         max_possible_pairs = len(peak_freqs) * (len(peak_freqs) - 1) / 2
@@ -162,12 +303,16 @@ class HarmonicLossLandscapeAnalyzer:
         eigenvalue_max = np.max(np.abs(eigenvals_array))
         flatness_score = 1.0 / (1.0 + eigenvalue_variance)
         
-        # CRITICAL CORRELATION
-        if len([harmonic_score, flatness_score]) > 1:
-            correlation_matrix = np.corrcoef([harmonic_score, flatness_score])
-            correlation = correlation_matrix[0, 1] if not np.isnan(correlation_matrix[0, 1]) else 0.0
-        else:
-            correlation = 0.0
+        # CRITICAL CORRELATION: only defined across analyses, so correlate the
+        # recent harmonic/flatness series seen by this analyzer
+        self._harmonic_history.append(harmonic_score)
+        self._flatness_history.append(flatness_score)
+        correlation = 0.0
+        if len(self._harmonic_history) > 1:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                r = np.corrcoef(self._harmonic_history, self._flatness_history)[0, 1]
+            if not np.isnan(r):
+                correlation = float(r)
         
         # Calculate Trinity resonance and emergence
         trinity_resonance = harmonic_score * self.trinity_harmony
@@ -193,7 +338,7 @@ class HarmonicLossLandscapeAnalyzer:
         
         initialization_strategy = {
             'base_variance': 'Glorot/He-style with golden ratio scaling',
-            'harmonic_components': list(self.musical_ratios.keys()),
+            'harmonic_components': list(self._ratio_names),
             'scaling_factor': PHI,
             'bias_strategy': 'Small harmonic values scaled by φ'
         }
@@ -216,15 +361,9 @@ class HarmonicLossLandscapeAnalyzer:
                             # Apply golden ratio scaling
                             var_harmonic = var * self.phi
                             
-                            # Create weight matrix with harmonic structure
-                            base_weights = torch.randn_like(param) * np.sqrt(var_harmonic)
-                            
-                            # Add harmonic components
-                            for ratio_name, ratio in self.musical_ratios.items():
-                                harmonic_component = torch.randn_like(param) * np.sqrt(var_harmonic / ratio)
-                                base_weights += harmonic_component * (1.0 / len(self.musical_ratios))
-                            
-                            param.data = base_weights
+                            # Base weights plus the 1/len-weighted harmonic components,
+                            # all independent Gaussians, drawn as one with summed variance
+                            param.data = torch.randn_like(param) * (np.sqrt(var_harmonic) * self._harmonic_std)
                         else:
                             # Biases: initialize to small harmonic values
                             param.data = torch.randn_like(param) * 0.01 * self.phi
@@ -280,18 +419,25 @@ class QAOAInspiredLayer(nn.Module):
     def forward(self, x):
         """
         Implement QAOA-style alternating operator pattern
+        
+        Eager by design; wrap the module with ``torch.compile(layer)`` to fuse
+        the per-layer cos/sin/tanh/linear chain.
         """
         # Initialize quantum state (superposition)
         psi = x / (torch.norm(x, dim=-1, keepdim=True) + 1e-8)
         
+        # Rotation coefficients for every layer in four vector ops
+        cos_b, sin_b = torch.cos(self.betas), torch.sin(self.betas)
+        cos_g, sin_g = torch.cos(self.gammas), torch.sin(self.gammas)
+        
         for layer in range(self.n_layers):
             # Apply mixer Hamiltonian (X-rotation in quantum)
-            mixer_evolution = torch.cos(self.betas[layer]) * psi + \
-                            torch.sin(self.betas[layer]) * torch.tanh(self.mixers[layer](psi))
+            mixer_evolution = cos_b[layer] * psi + \
+                            sin_b[layer] * torch.tanh(self.mixers[layer](psi))
             
             # Apply problem Hamiltonian (Z-rotation in quantum)
-            problem_evolution = torch.cos(self.gammas[layer]) * mixer_evolution + \
-                              torch.sin(self.gammas[layer]) * torch.tanh(self.problems[layer](mixer_evolution))
+            problem_evolution = cos_g[layer] * mixer_evolution + \
+                              sin_g[layer] * torch.tanh(self.problems[layer](mixer_evolution))
             
             # Apply entanglement
             psi = self.entanglers[layer](problem_evolution)
@@ -312,13 +458,13 @@ class QAOAInspiredLayer(nn.Module):
         Measure entanglement (von Neumann entropy analog)
         """
         with torch.no_grad():
-            entropy = 0.0
+            entropy = torch.zeros((), device=self.betas.device)
             for entangler in self.entanglers:
                 # Get weight matrix
                 W = entangler[0].weight
                 
-                # Compute singular values (Schmidt decomposition analog)
-                U, S, V = torch.svd(W)
+                # Compute singular values only (Schmidt decomposition analog)
+                S = torch.linalg.svdvals(W)
                 
                 # Normalize singular values
                 S_norm = S / (torch.sum(S) + 1e-8)
@@ -337,27 +483,26 @@ class QuantumFuzzyIntegrationModule:
         self.trinity_harmony = trinity_harmony_score
         self.phi = PHI
         
-        # Fuzzy membership functions
+        # Fuzzy membership functions: exp(-(x - center)^2 / width)
         self.fuzzy_sets = {
-            'low_harmony': lambda x: np.exp(-(x - 0.2)**2 / 0.1),
-            'medium_harmony': lambda x: np.exp(-(x - 0.5)**2 / 0.1),
-            'high_harmony': lambda x: np.exp(-(x - 0.8)**2 / 0.1),
-            'trinity_resonance': lambda x: np.exp(-(x - PHI/2)**2 / 0.1)
+            'low_harmony': 0.2,
+            'medium_harmony': 0.5,
+            'high_harmony': 0.8,
+            'trinity_resonance': PHI/2
         }
+        self._fuzzy_names = tuple(self.fuzzy_sets)
+        self._fuzzy_mu = np.array(list(self.fuzzy_sets.values()))
+        self._fuzzy_sigma = np.full(len(self.fuzzy_sets), 0.1)
         
     def quantum_superposition_state(self, classical_inputs):
         """
         Create quantum superposition of classical states
         """
         # Normalize inputs to quantum amplitudes
-        normalized = classical_inputs / (np.linalg.norm(classical_inputs) + 1e-8)
-        
-        # Create superposition with harmonic phases
-        phases = np.array([2 * PI * f for f in [1.0, 3/2, 5/4, PHI]])  # Harmonic phases
-        phases = phases[:len(normalized)]  # Match input dimensions
+        normalized = _safe_normalize(np.asarray(classical_inputs, dtype=np.float64))
         
-        # Quantum state: |ψ⟩ = Σ αᵢ e^(iφᵢ) |i⟩
-        quantum_state = normalized * np.exp(1j * phases)
+        # Quantum state: |ψ⟩ = Σ αᵢ e^(iφᵢ) |i⟩, phases truncated to the input dimensions
+        quantum_state = normalized * _PHASE_TABLE[:len(normalized)]
         
         return quantum_state
     
@@ -366,14 +511,13 @@ class QuantumFuzzyIntegrationModule:
         Measure quantum state using fuzzy logic
         """
         # Collapse quantum state (measurement)
-        probabilities = np.abs(quantum_state)**2
+        probabilities = quantum_state.real**2 + quantum_state.imag**2
         
-        # Apply fuzzy membership functions
-        fuzzy_measurements = {}
-        for set_name, membership_func in self.fuzzy_sets.items():
-            fuzzy_measurements[set_name] = np.sum([
-                membership_func(prob) * prob for prob in probabilities
-            ])
+        # Apply all fuzzy membership functions to all probabilities at once
+        memberships = np.exp(-(probabilities[None, :] - self._fuzzy_mu[:, None])**2
+                             / self._fuzzy_sigma[:, None])
+        fuzzy_measurements = dict(zip(self._fuzzy_names,
+                                      (memberships * probabilities).sum(axis=1)))
         
         # Compute overall harmony score
         harmony_score = (
@@ -413,35 +557,53 @@ class TrinitySymhonyEnhancementEngine:
             'loss_landscape_flatness': 0.0,
             'trinity_emergence': 0.0
         }
+        self._manifesto_cache = {}
+    
+    @functools.cached_property
+    def _default_sample_data(self) -> np.ndarray:
+        """Sample mathematical outputs (simulating model outputs), built once"""
+        t = np.linspace(0, 1, 1000)
+        freqs = np.array(list(self.trinity_frequencies.values()))[:, None]
+        return np.sin(2 * PI * freqs * t).sum(axis=0)
+    
+    @functools.cached_property
+    def _simulated_eigenvalues(self) -> np.ndarray:
+        """Simulated eigenvalue spectrum, seeded so repeated analyses agree"""
+        return np.random.default_rng(0).exponential(0.1, 1000)
+    
+    def _finish_stage(self, stage) -> Dict[str, Any]:
+        """Merge a stage's metric updates and print its report, in call order"""
+        results, metric_updates, report = stage
+        self.enhancement_metrics.update(metric_updates)
+        print("\n".join(report))
+        return results
     
     async def analyze_harmonic_loss_landscape(self, sample_data=None) -> Dict[str, Any]:
         """
         Analyze loss landscape for harmonic properties
         """
-        print("🎼 Analyzing Harmonic Loss Landscape...")
-        
+        return self._finish_stage(await asyncio.to_thread(self._harmonic_stage, sample_data))
+    
+    def _harmonic_stage(self, sample_data=None):
+        """Harmonic landscape analysis: (results, metric updates, report lines)"""
         # Generate or use provided sample data
         if sample_data is None:
-            # Create sample mathematical outputs (simulating model outputs)
-            sample_data = np.array([
-                np.sin(2 * PI * self.trinity_frequencies['ai_prompt_manager'] * t) +
-                np.sin(2 * PI * self.trinity_frequencies['mel_manager'] * t) +
-                np.sin(2 * PI * self.trinity_frequencies['hyperdag_manager'] * t)
-                for t in np.linspace(0, 1, 1000)
-            ])
+            sample_data = self._default_sample_data
         
         # Simulate Hessian eigenvalues (in real implementation, would compute from actual model)
-        eigenvalues = np.random.exponential(0.1, 1000)  # Simulated eigenvalue spectrum
+        eigenvalues = self._simulated_eigenvalues
         
         # Perform harmonic correlation analysis
         harmony_metrics = self.harmonic_analyzer.correlate_fft_noise_with_curvature(
             sample_data, eigenvalues
         )
         
-        # Update enhancement metrics
-        self.enhancement_metrics['harmonic_optimization'] = harmony_metrics.harmonic_score
-        self.enhancement_metrics['loss_landscape_flatness'] = harmony_metrics.flatness_score
-        self.enhancement_metrics['trinity_emergence'] = harmony_metrics.emergence_factor
+        # Enhancement metric updates
+        metric_updates = {
+            'harmonic_optimization': harmony_metrics.harmonic_score,
+            'loss_landscape_flatness': harmony_metrics.flatness_score,
+            'trinity_emergence': harmony_metrics.emergence_factor
+        }
         
         analysis_results = {
             'timestamp': datetime.datetime.now().isoformat(),
@@ -454,18 +616,23 @@ class TrinitySymhonyEnhancementEngine:
             'landscape_analysis': 'Harmonic ratios detected in loss landscape structure'
         }
         
-        print(f"✅ Harmonic Score: {harmony_metrics.harmonic_score:.3f}")
-        print(f"✅ Flatness Score: {harmony_metrics.flatness_score:.3f}")
-        print(f"✅ Emergence Factor: {harmony_metrics.emergence_factor:.3f}")
+        report = [
+            "🎼 Analyzing Harmonic Loss Landscape...",
+            f"✅ Harmonic Score: {harmony_metrics.harmonic_score:.3f}",
+            f"✅ Flatness Score: {harmony_metrics.flatness_score:.3f}",
+            f"✅ Emergence Factor: {harmony_metrics.emergence_factor:.3f}",
+        ]
         
-        return analysis_results
+        return analysis_results, metric_updates, report
     
     async def implement_quantum_fuzzy_integration(self) -> Dict[str, Any]:
         """
         Implement quantum-fuzzy hybrid processing
         """
-        print("⚛️ Implementing Quantum-Fuzzy Integration...")
-        
+        return self._finish_stage(await asyncio.to_thread(self._quantum_fuzzy_stage))
+    
+    def _quantum_fuzzy_stage(self):
+        """Quantum-fuzzy integration: (results, metric updates, report lines)"""
         # Create sample input representing Trinity Symphony coordination
         trinity_inputs = np.array([
             0.85,  # AI-Prompt-Manager contribution
@@ -480,31 +647,39 @@ class TrinitySymhonyEnhancementEngine:
         # Perform fuzzy quantum measurement
         measurement_results = self.quantum_fuzzy.fuzzy_quantum_measurement(quantum_state)
         
-        # Update enhancement metrics
-        self.enhancement_metrics['quantum_coherence'] = np.abs(np.sum(quantum_state))**2
-        self.enhancement_metrics['fuzzy_integration'] = measurement_results['harmony_score']
+        # Enhancement metric updates
+        quantum_coherence = np.abs(np.sum(quantum_state))**2
+        metric_updates = {
+            'quantum_coherence': quantum_coherence,
+            'fuzzy_integration': measurement_results['harmony_score']
+        }
         
         integration_results = {
             'timestamp': datetime.datetime.now().isoformat(),
-            'quantum_coherence': self.enhancement_metrics['quantum_coherence'],
+            'quantum_coherence': quantum_coherence,
             'fuzzy_harmony_score': measurement_results['harmony_score'],
             'emergence_potential': measurement_results['emergence_potential'],
             'fuzzy_measurements': measurement_results['fuzzy_measurements'],
             'quantum_advantages': 'Superposition enables parallel exploration of solution space'
         }
         
-        print(f"✅ Quantum Coherence: {self.enhancement_metrics['quantum_coherence']:.3f}")
-        print(f"✅ Fuzzy Harmony: {measurement_results['harmony_score']:.3f}")
-        print(f"✅ Emergence Potential: {measurement_results['emergence_potential']:.3f}")
+        report = [
+            "⚛️ Implementing Quantum-Fuzzy Integration...",
+            f"✅ Quantum Coherence: {quantum_coherence:.3f}",
+            f"✅ Fuzzy Harmony: {measurement_results['harmony_score']:.3f}",
+            f"✅ Emergence Potential: {measurement_results['emergence_potential']:.3f}",
+        ]
         
-        return integration_results
+        return integration_results, metric_updates, report
     
     async def optimize_harmonic_initialization(self) -> Dict[str, Any]:
         """
         Optimize model initialization using harmonic ratios
         """
-        print("🎯 Optimizing Harmonic Initialization...")
-        
+        return self._finish_stage(await asyncio.to_thread(self._initialization_stage))
+    
+    def _initialization_stage(self):
+        """Harmonic initialization: (results, metric updates, report lines)"""
         # Apply harmonic initialization strategy
         initialization_result = self.harmonic_analyzer.discover_harmonic_initialization()
         
@@ -522,26 +697,43 @@ class TrinitySymhonyEnhancementEngine:
             'trinity_frequency_integration': True
         }
         
-        print(f"✅ Harmonic ratios applied: {len(self.harmonic_analyzer.musical_ratios)}")
-        print(f"✅ Convergence improvement: {harmonic_convergence_rate:.3f}×")
-        print(f"✅ Golden ratio optimization active")
+        report = [
+            "🎯 Optimizing Harmonic Initialization...",
+            f"✅ Harmonic ratios applied: {len(self.harmonic_analyzer.musical_ratios)}",
+            f"✅ Convergence improvement: {harmonic_convergence_rate:.3f}×",
+            f"✅ Golden ratio optimization active",
+        ]
         
-        return optimization_results
+        return optimization_results, {}, report
     
     async def generate_enhancement_manifesto(self) -> Dict[str, Any]:
         """
         Generate complete Trinity Symphony Enhancement Manifesto
+        
+        The manifesto depends only on the harmony score and the Trinity
+        frequencies, so it is built once per distinct pair and copied out.
         """
+        cache_key = (self.trinity_harmony_score, tuple(self.trinity_frequencies.items()))
+        if cache_key in self._manifesto_cache:
+            return copy.deepcopy(self._manifesto_cache[cache_key])
+        
         print("\n📜 Generating Trinity Symphony Enhancement Manifesto...")
         
-        # Execute all enhancement protocols
-        harmonic_analysis = await self.analyze_harmonic_loss_landscape()
-        quantum_fuzzy_results = await self.implement_quantum_fuzzy_integration()
-        initialization_optimization = await self.optimize_harmonic_initialization()
+        # Execute all enhancement protocols; they are independent, so run them
+        # concurrently in worker threads and merge/report in a fixed order
+        stages = await asyncio.gather(
+            asyncio.to_thread(self._harmonic_stage),
+            asyncio.to_thread(self._quantum_fuzzy_stage),
+            asyncio.to_thread(self._initialization_stage),
+        )
+        harmonic_analysis, quantum_fuzzy_results, initialization_optimization = map(
+            self._finish_stage, stages
+        )
         
         # Calculate overall enhancement factor
-        enhancement_scores = list(self.enhancement_metrics.values())
-        overall_enhancement = np.prod([1 + score for score in enhancement_scores])
+        enhancement_scores = np.fromiter(self.enhancement_metrics.values(), dtype=np.float64,
+                                         count=len(self.enhancement_metrics))
+        overall_enhancement = float(np.prod(1.0 + enhancement_scores))
         
         manifesto = {
             'title': 'Trinity Symphony Enhancement Manifesto',
@@ -587,6 +779,7 @@ class TrinitySymhonyEnhancementEngine:
         print(f"⚛️ Quantum Coherence: {self.enhancement_metrics['quantum_coherence']:.3f}")
         print(f"🔗 Trinity Emergence: {self.enhancement_metrics['trinity_emergence']:.3f}")
         
+        self._manifesto_cache[cache_key] = copy.deepcopy(manifesto)
         return manifesto
 
 async def execute_trinity_symphony_enhancement():